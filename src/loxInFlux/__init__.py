@@ -1,18 +1,18 @@
 from .app import LoxInfluxBridge, main
-from .config import config
+from .config import get_config
 from .logger import get_lazy_logger, configure_logging, initialize_logging, LazyLogger
 from .utils import log_performance
-from .telegraf import telegraf
+from .telegraf import get_telegraf
 
 __all__ = [
     "LoxInfluxBridge", 
-    "config", 
+    "get_config",
     "get_lazy_logger",
     "configure_logging",
     "initialize_logging",
     "LazyLogger",
     "main", 
     "log_performance", 
-    "telegraf"
+    "get_telegraf"
 ]
 __version__ = "0.1.0"
@@ -1,32 +1,43 @@
 import logging
 import asyncio
 import time
-import orjson
 
 from loxwebsocket.exceptions import LoxoneException
-from .config import config
+from .config import get_config
 from loxwebsocket.lox_ws_api import LoxWs, loxwebsocket
 from loxInFlux.miniserver import getControlsFromConfigXML, load_miniserver_config
-from .telegraf import telegraf
+from .telegraf import get_telegraf
 import signal
 import uvloop
-from .utils import _build_base_url, get_numeric_value_if_possible, initialize_logging
+from .utils import _build_base_url, close_session, format_line_protocol_fields, initialize_logging, make_numeric_value_parser
 from .grabber import LoxoneGrabber
 from .logger import get_lazy_logger
 
 logger = get_lazy_logger(__name__)
 
+# Upper bound of line protocol records waiting for the Telegraf writer
+TELEGRAF_QUEUE_SIZE = 10000
+# Maximum number of queued records merged into a single Telegraf write
+TELEGRAF_BATCH_SIZE = 500
+
 def on_exit():
     logger.info("LoxInFlux exited")
 
 class LoxInfluxBridge:
 
     def __init__(self):
+        config = get_config()
         self.base_url = _build_base_url()
+        self.telegraf = get_telegraf()
+        # Round float values if configured, otherwise use the shortest repr of the float (dtoa fast path)
+        self._value_format = b"%%.%df" % config.general.rounding_precision if config.general.round_floats else b"%r"
+        self._numeric_value = make_numeric_value_parser(config.general.round_floats, config.general.rounding_precision)
         self.ws_client = None
         self._shutdown_event = asyncio.Event()
         self._tasks = set()
         self.websocket_controls = {}
+        # uuid -> point_websocket_template of all websocket controls, the only thing handle_value_states needs per value
+        self.websocket_templates = {}
         # Add message type handlers dictionary
         self._message_handlers = {
             2: self.handle_value_states  # Register handler for value states
@@ -35,87 +46,123 @@ class LoxInfluxBridge:
         self.controls = {}
         self.ws_client_initialized = asyncio.Event()
         self.grabber_controls_updated = asyncio.Event()
-        self.formatter =  f"{{:.{config.general.rounding_precision if config.general.round_floats else 15}f}}".format
+        self._telegraf_queue = asyncio.Queue(maxsize=TELEGRAF_QUEUE_SIZE)
 
     
-    def get_controls(self):
+    def get_controls_snapshot(self):
         return self.controls, self.websocket_controls, self.grabber_controls
 
     async def handle_value_states(self, message, message_type):
         """Handler for value state messages (type 2)"""
-        timestamp = b" " + orjson.dumps(time.time_ns())
+        # Encoded once per message, bytes %d goes through a temporary str each time
+        timestamp = b"%d" % time.time_ns()
+        templates = self.websocket_templates
+        put = self._telegraf_queue.put_nowait
+        # Checked once per message against the cached level, so that misses skip the logger call entirely
+        debug_enabled = logger.effective_level <= logging.DEBUG
 
-        for uuid, value in message.items():
-            try:
-                # Round float values if configured
-                point = b"".join([self.websocket_controls[uuid]["point_websocket"],  self.formatter(value).encode(), timestamp])
-                asyncio.create_task(telegraf.write(point))
-            except KeyError:
-                if uuid in self.controls:
-                    logger.warning("%s not in initial websocket controls list. It is in the overall controls though. adding it to websocket controls.", uuid) 
-                    self.websocket_controls[uuid] = self.controls[uuid]
-                    point = b"".join([self.websocket_controls[uuid]["point_websocket"],  self.formatter(value).encode(), timestamp])
-                    asyncio.create_task(telegraf.write(point))
-                else:
-                    logger.debug("Omitting %s because it is not in the (websocket) controls list", uuid)
+        try:
+            for uuid, value in message.items():
+                try:
+                    put(templates[uuid] % (value, timestamp))
+                except KeyError:
+                    if uuid in self.controls:
+                        logger.warning("%s not in initial websocket controls list. It is in the overall controls though. adding it to websocket controls.", uuid) 
+                        self.websocket_controls[uuid] = self.controls[uuid]
+                        templates[uuid] = self.controls[uuid]["point_websocket_template"]
+                        put(templates[uuid] % (value, timestamp))
+                    elif debug_enabled:
+                        logger.debug("Omitting %s because it is not in the (websocket) controls list", uuid)
+        except asyncio.QueueFull:
+            logger.warning("Telegraf queue is full - dropping remaining values of this message")
         #for uuid, value in message.items():
         #    await self.process_loxone_value_state_item(uuid, value, timestamp)
         #tasks = map(lambda item: self.process_loxone_value_state_item(item[0], item[1], timestamp), message.items())
         #await asyncio.gather(*tasks)
 
     async def handle_text_messages(self, message, message_type):
-        if isinstance(message, dict) and len(message) == 1:
-            uuid, message = next(iter(message.items()))
-            if uuid in self.grabber_controls:
-                control = self.grabber_controls[uuid]
-                point = control["pointInflux"].tag("source","grabber").field("Default",get_numeric_value_if_possible(message["value"]))
-                if "output0" in message: # At least one additional output is present
-                    for key, value in message.items():
-                        if "output" in key and "value" in value:
-                            point = point.field(str(value.get("name") if value.get("name") else value.get("nr") if value.get("nr") else b'Subdefault'), get_numeric_value_if_possible(value.get("value"))).time(time.time_ns())
-                await telegraf.write(point.to_line_protocol().encode())
-            else:
-                logger.warning("Omitting %s because it is not in the grabber controls list", uuid)
+        try:
+            # Only single control answers ({uuid: message}) are of interest
+            (uuid, message), = message.items()
+        except (AttributeError, ValueError):
+            return
+        if uuid in self.grabber_controls:
+            control = self.grabber_controls[uuid]
+            numeric_value = self._numeric_value
+            fields = {"Default": numeric_value(message["value"])}
+            if "output0" in message: # At least one additional output is present
+                for key, value in message.items():
+                    if "output" in key and "value" in value:
+                        fields[str(value.get("name") if value.get("name") else value.get("nr") if value.get("nr") else b'Subdefault')] = numeric_value(value.get("value"))
+            field_set = format_line_protocol_fields(fields)
+            if field_set:
+                await self.telegraf.write(control["point_grabber_prefix"] + field_set + b" %d" % time.time_ns())
+        else:
+            logger.warning("Omitting %s because it is not in the grabber controls list", uuid)
+
+    async def _telegraf_writer(self):
+        """Forward queued line protocol records to Telegraf, merging everything that piled up meanwhile."""
+        queue = self._telegraf_queue
+        telegraf = self.telegraf
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty() and len(batch) < TELEGRAF_BATCH_SIZE:
+                batch.append(queue.get_nowait())
+            try:
+                # Looked up per batch - the TCP writer swaps write_many once initialize() finished, which
+                # only happens after this task started
+                await telegraf.write_many(batch)
+            except Exception as e:
+                logger.error("Failed to forward %d points to Telegraf: %s", len(batch), e)
+
+    async def _flush_telegraf_queue(self):
+        """Write all records that are still queued."""
+        queue = self._telegraf_queue
+        batch = []
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        if batch:
+            await self.telegraf.write_many(batch)
 
     async def main(self):
+        writer_task = asyncio.create_task(self._telegraf_writer())
+        self._tasks.add(writer_task)
+        writer_task.add_done_callback(self._tasks.discard)
         # Initialize telegraf connection and gather controls
         await asyncio.gather(
-            telegraf.initialize(), 
+            self.telegraf.initialize(), 
             self.init_gather_controls_from_miniserver(),
-            self.init_websocket_connection(),
-            self.init_grabber())
+            self.init_websocket_connection())
+        # The grabber needs both the controls and the websocket connection, start it only once both are ready
+        await self.init_grabber()
         await self._shutdown_event.wait()
 
     async def udpate_controls(self):
-        await self.ws_client_initialized.wait()
-        await self.grabber_controls_updated.wait()
-        asyncio.create_task(self.init_gather_controls_from_miniserver())
-
-    async def get_controls(self):
-        return self.controls, self.websocket_controls, self.grabber_controls
+        await asyncio.gather(self.ws_client_initialized.wait(), self.grabber_controls_updated.wait())
+        # loxwebsocket already runs event callbacks as tasks, so re-gather inline -
+        # errors then surface through its callback error logging
+        await self.init_gather_controls_from_miniserver()
 
     async def init_grabber(self):
         self.grabber = LoxoneGrabber()
-        ws_init_task = asyncio.create_task(self.ws_client_initialized.wait())
-        grabber_controls_task = asyncio.create_task(self.grabber_controls_updated.wait())
         self._message_handlers[0] = self.handle_text_messages
         self.ws_client.add_message_callback(self.handle_text_messages, message_types=[0])
-        # Wait for controls to be gathered and websocket connection to be established
-        await asyncio.wait([ws_init_task, grabber_controls_task],return_when=asyncio.ALL_COMPLETED)
-        grabber_task = asyncio.create_task(self.grabber.start(self.get_controls))
+        grabber_task = asyncio.create_task(self.grabber.start(self.get_controls_snapshot))
         self._tasks.add(grabber_task)
         grabber_task.add_done_callback(self._tasks.discard)
 
     async def init_gather_controls_from_miniserver(self):
-        config_xml, loxapp3_json = await load_miniserver_config(config.miniserver.host, config.miniserver.user, config.miniserver.password, persist=True)
-        self.loxapp3_json_control = [control.replace("U:", "") for control in loxapp3_json["controls"]]
-        new_controls, new_websocket_controls, new_grabber_controls = getControlsFromConfigXML(config_xml)
-        new_websocket_controls = config.control.websocket.filter_controls(new_websocket_controls)
-        new_grabber_controls = config.control.grabber.filter_controls(new_grabber_controls)
+        miniserver = get_config().miniserver
+        config_xml, loxapp3_json = await load_miniserver_config(miniserver.host, miniserver.user, miniserver.password, persist=True)
+        # Parsing and filtering is CPU bound - keep the event loop serving websocket frames meanwhile
+        self.loxapp3_json_control, new_controls, new_websocket_controls, new_grabber_controls = await asyncio.to_thread(
+            self._extract_controls, config_xml, loxapp3_json)
         self.controls.clear()
         self.controls.update(new_controls)
         self.websocket_controls.clear()
         self.websocket_controls.update(new_websocket_controls)
+        self.websocket_templates.clear()
+        self.websocket_templates.update((uuid, control["point_websocket_template"]) for uuid, control in new_websocket_controls.items())
         self.grabber_controls.clear()
         self.grabber_controls.update(new_grabber_controls)
         logger.info("Extracted %d controls, %d websocket controls, %d grabber controls", 
@@ -124,22 +171,42 @@ class LoxInfluxBridge:
         self.grabber_controls_updated.set()
         
     
+    def _extract_controls(self, config_xml, loxapp3_json):
+        """Extract, template and filter the controls of the miniserver configuration. Runs in a worker thread."""
+        loxapp3_json_control = [control.replace("U:", "") for control in loxapp3_json["controls"]]
+        new_controls, new_websocket_controls, new_grabber_controls = getControlsFromConfigXML(config_xml)
+        self._add_line_protocol_templates(new_controls)
+        control_config = get_config().control
+        new_websocket_controls = control_config.websocket.filter_controls(new_websocket_controls)
+        new_grabber_controls = control_config.grabber.filter_controls(new_grabber_controls)
+        return loxapp3_json_control, new_controls, new_websocket_controls, new_grabber_controls
+
+    def _add_line_protocol_templates(self, controls):
+        """Precompute the static line protocol parts the websocket and grabber values are written with."""
+        value_format = self._value_format
+        for control in controls.values():
+            # Static part with escaped %, filled with (value, timestamp) per value state
+            control["point_websocket_template"] = control["point_websocket"].replace(b"%", b"%%") + value_format + b" %b"
+            # Measurement and tag set up to the field set, which is built per grabber answer
+            field_set = format_line_protocol_fields({control["fieldkey"]: "[valueplaceholder]"})
+            control["point_grabber_prefix"] = control["point"].replace(b"[sourceplaceholder]", b"grabber")[:-len(field_set)]
+
     async def init_websocket_connection(self):
+        """Connect to the miniserver websocket and register the callbacks. Returns as soon as the connection is ready,
+        the client is stopped in shutdown()."""
         try:
             self.ws_client = loxwebsocket
-            await self.ws_client.connect(user=config.miniserver.user,password=config.miniserver.password,loxone_url=self.base_url, max_reconnect_attempts=config.miniserver.max_reconnect_attempts)
+            miniserver = get_config().miniserver
+            await self.ws_client.connect(user=miniserver.user,password=miniserver.password,loxone_url=self.base_url, max_reconnect_attempts=miniserver.max_reconnect_attempts)
             # Register callback for specific message types
             self.ws_client.add_message_callback(self.handle_value_states, message_types=[2])
             self.ws_client.add_event_callback(self.udpate_controls, event_types=[LoxWs.EventType.RECONNECTED])
             self.ws_client_initialized.set()
-            await self._shutdown_event.wait()
         except LoxoneException as e:
             logger.error("Failed to establish or maintain WebSocket connection: %s", e)
+            await self.ws_client.stop()
             # Attempts to Reconnect not successfull - shutting down
             raise RuntimeError(f"Failed to establish or maintain WebSocket connection: {e}")  # Exception message - f-string ok
-        finally:
-            if self.ws_client:
-                await self.ws_client.stop()
 
     async def shutdown(self):
         """Cleanup method to be called on shutdown"""
@@ -148,7 +215,9 @@ class LoxInfluxBridge:
         
         if self.ws_client:
             await self.ws_client.stop()
-        await telegraf.close()
+        await self._flush_telegraf_queue()
+        await self.telegraf.close()
+        await close_session()
         
         # Cancel all remaining tasks
         tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
@@ -171,16 +240,21 @@ async def run_bridge(bridge):
 
     # Start the bridge main task
     main_task = asyncio.create_task(bridge.main())
+    shutdown_task = asyncio.create_task(shutdown_event.wait())
 
-    # Wait for shutdown signal
-    await shutdown_event.wait()
-
-    # Initiate shutdown
-    main_task.cancel()
     try:
-        await main_task
-    except asyncio.CancelledError:
-        pass
+        # Wait for shutdown signal - or the bridge failing on its own
+        await asyncio.wait([main_task, shutdown_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # Initiate shutdown
+        main_task.cancel()
+        try:
+            await main_task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            # Run cleanup on the same loop instead of spinning up a second one
+            await bridge.shutdown()
 
 
 def main():
@@ -189,18 +263,14 @@ def main():
     
     bridge = LoxInfluxBridge()
 
-    # Set uvloop as the default event loop policy
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-
     try:
-        asyncio.run(run_bridge(bridge))
+        # uvloop.run creates the uvloop event loop directly, no policy indirection
+        uvloop.run(run_bridge(bridge))
     except KeyboardInterrupt:
         pass
     except RuntimeError as e:
         logger.error("RuntimeError: %s", e)
     finally:
-        # Run cleanup
-        asyncio.run(bridge.shutdown())
         on_exit()
 
 
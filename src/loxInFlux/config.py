@@ -64,12 +64,13 @@ class FilterConfig:
 
     def __post_init__(self):
         # Since the class is frozen, we need to use object.__setattr__ to modify fields
-        object.__setattr__(self, 'type_blacklist', set(map(str.upper, self.type_blacklist)))
-        object.__setattr__(self, 'type_whitelist', set(map(str.upper, self.type_whitelist)))
-        object.__setattr__(self, 'uuid_blacklist', set(self.uuid_blacklist))
-        object.__setattr__(self, 'uuid_whitelist', set(self.uuid_whitelist))
+        object.__setattr__(self, 'type_blacklist', frozenset(map(str.upper, self.type_blacklist)))
+        object.__setattr__(self, 'type_whitelist', frozenset(map(str.upper, self.type_whitelist)))
+        # Control uuids are kept as bytes (see miniserver.extractControls), so encode once here
+        object.__setattr__(self, 'uuid_blacklist', frozenset(uuid.encode('utf-8') for uuid in self.uuid_blacklist))
+        object.__setattr__(self, 'uuid_whitelist', frozenset(uuid.encode('utf-8') for uuid in self.uuid_whitelist))
 
-    def should_include_control(self, control_type: str, uuid: str) -> bool:
+    def should_include_control(self, control_type: str, uuid: str | bytes) -> bool:
         """Determine if a control should be included based on the filter rules.
         
         Args:
@@ -79,8 +80,12 @@ class FilterConfig:
         Returns:
             bool: True if the control should be included, False otherwise
         """
-        control_type = control_type.upper()
-        
+        if isinstance(uuid, str):
+            uuid = uuid.encode('utf-8')
+        return self._should_include_upper(control_type.upper(), uuid)
+
+    def _should_include_upper(self, control_type: str, uuid: bytes) -> bool:
+        """should_include_control for an already upper-cased control type."""
         # If whitelists are not empty, only include items in the whitelist
         if self.type_whitelist:
             if control_type not in self.type_whitelist:
@@ -104,34 +109,18 @@ class FilterConfig:
             including parent-child relationship checks
         """
         filtered = {}
-        
-        def should_include(uuid: str, control: Dict) -> bool:
-            # Get control type
-            control_type = control['type']
-            
-            # Check if control passes basic filter
-            if not self.should_include_control(control_type, uuid):
-                return False
-                
-            # For subcontrols, check if parent is included
-            if 'parent_uuid' in control:
-                parent_uuid = control['parent_uuid']
-                parent = controls.get(parent_uuid)
-                if not parent:
-                    return False
-                if not self.should_include_control(parent['type'], parent_uuid):
-                    return False
-                    
-            return True
+        # Control types are upper-cased when the controls are extracted
+        should_include = self._should_include_upper
 
         # First add all non-subcontrols that pass the filter
         for uuid, control in controls.items():
-            if 'parent_uuid' not in control and should_include(uuid, control):
+            if 'parent_uuid' not in control and should_include(control['type'], uuid):
                 filtered[uuid] = control
 
-        # Then add all subcontrols whose parents were included
+        # Then add all subcontrols that pass the filter and whose parents were included.
+        # Up to here filtered only holds parents, so it doubles as the memo of included parents.
         for uuid, control in controls.items():
-            if 'parent_uuid' in control and should_include(uuid, control):
+            if 'parent_uuid' in control and control['parent_uuid'] in filtered and should_include(control['type'], uuid):
                 filtered[uuid] = control
 
         return filtered
@@ -143,8 +132,8 @@ class ControlConfig:
     grabber: FilterConfig = field(default_factory=FilterConfig)
 
     def __post_init__(self):
-        # Convert main type_blacklist to set and uppercase
-        self.type_blacklist = set(map(str.upper, self.type_blacklist))
+        # Convert main type_blacklist to frozenset and uppercase
+        self.type_blacklist = frozenset(map(str.upper, self.type_blacklist))
 
 @dataclass
 class GeneralConfig:
@@ -218,13 +207,28 @@ class AppConfig:
         )
 
 # Statt direkter Initialisierung eine Funktion für die Initialisierung bereitstellen
-config =  AppConfig.load()
+_config: Optional[AppConfig] = None
+
+
+def get_config() -> AppConfig:
+    """Get the application configuration, loading it (and parsing the arguments) on first use."""
+    global _config
+    if _config is None:
+        _config = AppConfig.load()
+    return _config
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps `from loxInFlux.config import config` working while deferring the load to first access
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # For backwards compatibility
 def get(section: str, key: str, default: Any = None) -> Any:
     """Get a configuration value (legacy method)."""
-    section_obj = getattr(config, section, None)
+    section_obj = getattr(get_config(), section, None)
     if section_obj is None:
         return default
     return getattr(section_obj, key, default)
\ No newline at end of file
@@ -2,50 +2,68 @@ import asyncio
 import logging
 from loxwebsocket.lox_ws_api import loxwebsocket
 from typing import Callable
-from .config import config
+from .config import get_config
 from .logger import get_lazy_logger
 
 logger = get_lazy_logger(__name__)
 
+# Anzahl gleichzeitig laufender Grabber-Befehle
+GRABBER_WORKERS = 10
+
 class LoxoneGrabber:
     def __init__(self):
         self._shutdown_event = asyncio.Event()
-        self.semaphore = asyncio.Semaphore(10)
+        self._cmd_queue = asyncio.Queue()
     
     async def start(self, controls_getter: Callable[[], tuple[dict, dict, dict]]):
         self.ws_client = loxwebsocket
         self.controlGetter = controls_getter    
         """Start the grabber task."""
+        config = get_config()
         if not config.general.grabber:
             logger.info("Grabber ist in der Konfiguration deaktiviert")
             return
 
         logger.info("Starte Loxone Grabber mit Intervall: %d Sekunden", 
                    config.general.grabber_interval)
-        
-        while not self._shutdown_event.is_set():
+
+        # Feste Anzahl Worker statt eines Tasks pro Kontrolle und Durchlauf
+        workers = [asyncio.create_task(self._command_worker()) for _ in range(GRABBER_WORKERS)]
+        try:
+            while not self._shutdown_event.is_set():
+                try:
+                    await self._grab_all_values()
+                    await asyncio.sleep(config.general.grabber_interval)
+                except Exception as e:
+                    logger.error("Fehler in der Grabber-Schleife: %s", e)
+                    await asyncio.sleep(5)  # Warte etwas bevor erneut versucht wird
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _command_worker(self):
+        """Arbeitet Grabber-Befehle aus der Warteschlange ab."""
+        queue = self._cmd_queue
+        while True:
+            uuid, secured = await queue.get()
             try:
-                await self._grab_all_values()
-                await asyncio.sleep(config.general.grabber_interval)
-            except Exception as e:
-                logger.error("Fehler in der Grabber-Schleife: %s", str(e))
-                await asyncio.sleep(5)  # Warte etwas bevor erneut versucht wird
+                await self.send_command(uuid, secured)
+            finally:
+                queue.task_done()
 
     async def send_command(self, uuid, secured=False):
-          # Begrenze die gleichzeitigen Aufgaben
-        async with self.semaphore:
-            if self._shutdown_event.is_set():
-                return
-            try:
-                # TODO: Check why SequenceController are not working
-                if not secured:
-                    await self.ws_client.send_websocket_command(uuid, "all")
-                else:
-                    await self.ws_client.send_command_to_visu_password_secured_control(uuid, "all", config.miniserver.visu_password)
-                logger.debug("Grabber-Befehl für UUID gesendet: %s", uuid)
-            except Exception as e:
-                logger.error("Fehler beim Senden des Grabber-Befehls für UUID %s: %s", 
-                                uuid, str(e))
+        if self._shutdown_event.is_set():
+            return
+        try:
+            # TODO: Check why SequenceController are not working
+            if not secured:
+                await self.ws_client.send_websocket_command(uuid, "all")
+            else:
+                await self.ws_client.send_command_to_visu_password_secured_control(uuid, "all", get_config().miniserver.visu_password)
+            logger.debug("Grabber-Befehl für UUID gesendet: %s", uuid)
+        except Exception as e:
+            logger.error("Fehler beim Senden des Grabber-Befehls für UUID %s: %s", 
+                            uuid, e)
 
     async def _grab_all_values(self):
         """Fordert aktuelle Werte für alle Kontrollen in der Grabber-Liste an."""
@@ -53,14 +71,13 @@ class LoxoneGrabber:
             logger.error("Loxone WebSocket ist nicht verbunden")
             return
         
-        tasks = []
-        _,_,grabber_controls = await self.controlGetter()
+        _,_,grabber_controls = self.controlGetter()
+        put = self._cmd_queue.put_nowait
         for uuid, control in grabber_controls.items():
-            task = asyncio.create_task(self.send_command(uuid, control["VisuPwd"]))
-            tasks.append(task)
-        
-        if tasks:
-            await asyncio.gather(*tasks)
+            put((uuid, control["VisuPwd"]))
+
+        # Warten bis die Worker alle Befehle abgearbeitet haben
+        await self._cmd_queue.join()
 
     async def stop(self):
         """Stoppt die Grabber-Aufgabe."""
@@ -8,11 +8,12 @@ Provides:
 """
 
 import logging
+from logging import DEBUG, INFO, WARNING, ERROR
 import os
-import sys
 from typing import Optional
 
-from .config import config
+from .argparser import get_args
+from .config import get_config
 
 
 # =============================================================================
@@ -40,19 +41,18 @@ logging.Logger.trace = _trace
 class TelegrafFormatter(logging.Formatter):
     """Custom formatter for Telegraf execd logging format."""
     
+    # Prefixes include the separating space, so format() needs a single concatenation
     LEVEL_PREFIXES = {
-        logging.ERROR: 'E!',
-        logging.WARNING: 'W!',
-        logging.INFO: 'I!',
-        logging.DEBUG: 'D!',
-        TRACE_LEVEL: 'T!'
+        logging.ERROR: 'E! ',
+        logging.WARNING: 'W! ',
+        logging.INFO: 'I! ',
+        logging.DEBUG: 'D! ',
+        TRACE_LEVEL: 'T! '
     }
     
     def format(self, record):
         """Format the log record according to Telegraf execd specifications."""
-        prefix = self.LEVEL_PREFIXES.get(record.levelno, 'E!')
-        formatted_msg = super().format(record)
-        return f"{prefix} {formatted_msg}"
+        return self.LEVEL_PREFIXES.get(record.levelno, 'E! ') + logging.Formatter.format(self, record)
 
 
 # =============================================================================
@@ -63,72 +63,107 @@ class LazyLogger:
     """
     A logger wrapper that provides lazy evaluation for debug messages.
     
-    Caches the debug-enabled state for maximum performance, avoiding
-    repeated isEnabledFor() calls in hot-paths.
+    Caches the effective level as a plain int, so the per-call check is a
+    single integer compare instead of an isEnabledFor() walk up the logger
+    hierarchy in hot-paths. The cache is versioned against the logging
+    configuration generation and refreshed lazily on the first call after
+    a reconfiguration.
     
     Performance gain: 2-7x faster when DEBUG is disabled.
     Overhead when DEBUG enabled: ~2.3% (negligible).
     """
     
-    __slots__ = ('_logger', '_debug_enabled', '_trace_enabled')
+    __slots__ = ('_logger', '_level', '_generation')
     
     def __init__(self, logger: logging.Logger):
         """Initialize with an existing logger instance."""
         self._logger = logger
-        self._update_level_cache()
+        # Stale on purpose - the level is cached on the first call, configuring logging first if needed
+        self._level = logging.NOTSET
+        self._generation = -1
     
     def _update_level_cache(self):
-        """Update cached level states. Call this if the log level changes at runtime."""
-        self._debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
-        self._trace_enabled = self._logger.isEnabledFor(TRACE_LEVEL)
+        """Update the cached level. Happens automatically once the configuration generation changes."""
+        if not _configured:
+            _auto_configure()
+        self._level = self._logger.getEffectiveLevel()
+        self._generation = _config_generation
     
     def trace(self, msg: str, *args, **kwargs):
         """Log with TRACE level (5) - only if enabled."""
-        if self._trace_enabled:
+        if self._generation != _config_generation:
+            self._update_level_cache()
+        if self._level <= TRACE_LEVEL:
             self._logger.log(TRACE_LEVEL, msg, *args, **kwargs)
     
     def debug(self, msg: str, *args, **kwargs):
         """Log with DEBUG level - only if enabled."""
-        if self._debug_enabled:
+        if self._generation != _config_generation:
+            self._update_level_cache()
+        if self._level <= DEBUG:
             self._logger.debug(msg, *args, **kwargs)
     
     def info(self, msg: str, *args, **kwargs):
-        """Log with INFO level."""
-        self._logger.info(msg, *args, **kwargs)
+        """Log with INFO level - only if enabled."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
+        if self._level <= INFO:
+            self._logger.info(msg, *args, **kwargs)
     
     def warning(self, msg: str, *args, **kwargs):
-        """Log with WARNING level."""
-        self._logger.warning(msg, *args, **kwargs)
+        """Log with WARNING level - only if enabled."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
+        if self._level <= WARNING:
+            self._logger.warning(msg, *args, **kwargs)
     
     def error(self, msg: str, *args, **kwargs):
-        """Log with ERROR level."""
-        self._logger.error(msg, *args, **kwargs)
+        """Log with ERROR level - only if enabled."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
+        if self._level <= ERROR:
+            self._logger.error(msg, *args, **kwargs)
     
     def critical(self, msg: str, *args, **kwargs):
         """Log with CRITICAL level."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
         self._logger.critical(msg, *args, **kwargs)
     
     def exception(self, msg: str, *args, **kwargs):
         """Log exception with ERROR level."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
         self._logger.exception(msg, *args, **kwargs)
     
     def log(self, level: int, msg: str, *args, **kwargs):
         """Log with custom level."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
         self._logger.log(level, msg, *args, **kwargs)
     
     def isEnabledFor(self, level: int) -> bool:
         """Check if the logger is enabled for a given level."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
         return self._logger.isEnabledFor(level)
     
+    @property
+    def effective_level(self) -> int:
+        """Get the cached effective level - cheaper than isEnabledFor() for checks in hot-paths."""
+        if self._generation != _config_generation:
+            self._update_level_cache()
+        return self._level
+    
     @property
     def level(self) -> int:
         """Get the current log level."""
         return self._logger.level
     
     def setLevel(self, level: int):
-        """Set the log level and update cache."""
+        """Set the log level and invalidate the caches of all LazyLoggers, their effective levels may depend on it."""
         self._logger.setLevel(level)
-        self._update_level_cache()
+        _invalidate_level_caches()
 
 
 # =============================================================================
@@ -137,6 +172,8 @@ class LazyLogger:
 
 _configured = False
 _lazy_loggers: dict[str, LazyLogger] = {}
+# Bumped on every level change, LazyLoggers compare it against the generation their cached level belongs to
+_config_generation = 0
 
 
 def configure_logging(
@@ -160,18 +197,7 @@ def configure_logging(
     
     # Determine log level from various sources
     if level is None:
-        # Command line argument has highest priority
-        if len(sys.argv) > 1 and sys.argv[1].upper() == "--DEBUG":
-            level = "DEBUG"
-        # Check argparser if available
-        elif hasattr(config, '_args') and getattr(config._args, 'log_level', None):
-            level = config._args.log_level.upper()
-        # Environment variable has second priority
-        elif env_level := os.getenv("APP_LOG_LEVEL"):
-            level = env_level.upper()
-        # Config file has lowest priority
-        else:
-            level = config.logging.level
+        level = _resolve_log_level()
     
     # Get root logger
     root_logger = logging.getLogger()
@@ -195,16 +221,37 @@ def configure_logging(
     log_level = getattr(logging, level.upper(), logging.INFO)
     root_logger.setLevel(log_level)
     
-    # Update all existing LazyLogger instances
-    for lazy_logger in _lazy_loggers.values():
-        lazy_logger._update_level_cache()
+    # Existing LazyLogger instances pick the new level up on their next call
+    _invalidate_level_caches()
     
     _configured = True
 
 
+def _resolve_log_level() -> str:
+    """Log level from the command line, APP_LOG_LEVEL or the config file - in that order of priority."""
+    args = get_args()
+    if args.log_level:
+        return args.log_level.upper()
+    if env_level := os.getenv("APP_LOG_LEVEL"):
+        return env_level.upper()
+    return get_config().logging.level.upper()
+
+
+def _invalidate_level_caches() -> None:
+    """Start a new configuration generation, invalidating the cached level of every LazyLogger."""
+    global _config_generation
+    _config_generation += 1
+
+
+def _auto_configure() -> None:
+    """Configure logging from the configuration, done by the first LazyLogger call if nothing configured it before."""
+    use_telegraf = get_config().telegraf.protocol.lower() == "execd"
+    configure_logging(use_telegraf_format=use_telegraf)
+
+
 def get_lazy_logger(name: Optional[str] = None) -> LazyLogger:
     """
-    Get a LazyLogger instance with automatic configuration on first call.
+    Get a LazyLogger instance, logging is configured automatically on its first log call.
     
     This is a drop-in replacement for logging.getLogger() that provides
     automatic lazy evaluation for debug messages.
@@ -215,20 +262,14 @@ def get_lazy_logger(name: Optional[str] = None) -> LazyLogger:
     Returns:
         A LazyLogger instance with cached level checks.
     """
-    global _configured
-    
-    # Auto-configure on first use
-    if not _configured:
-        use_telegraf = config.telegraf.protocol.lower() == "execd"
-        configure_logging(use_telegraf_format=use_telegraf)
-    
     # Cache and return LazyLogger instances
     cache_key = name or "__root__"
-    if cache_key not in _lazy_loggers:
+    lazy_logger = _lazy_loggers.get(cache_key)
+    if lazy_logger is None:
         logger = logging.getLogger(name) if name else logging.getLogger()
-        _lazy_loggers[cache_key] = LazyLogger(logger)
+        lazy_logger = _lazy_loggers[cache_key] = LazyLogger(logger)
     
-    return _lazy_loggers[cache_key]
+    return lazy_logger
 
 
 def initialize_logging() -> object:
@@ -241,24 +282,18 @@ def initialize_logging() -> object:
     Returns:
         The parsed command line arguments.
     """
-    from loxInFlux.argparser import get_args
-    
-    args = get_args()
-    
-    # Set logging level - prioritize args over config
-    log_level = args.log_level.upper() if args.log_level else config.logging.level.upper()
-    
     # Determine if we should use Telegraf formatting
-    use_telegraf_format = config.telegraf.protocol.lower() == "execd"
+    use_telegraf_format = get_config().telegraf.protocol.lower() == "execd"
     
-    # Configure logging with appropriate format
-    configure_logging(log_level, use_telegraf_format, force=True)
+    # Configure logging with appropriate format, the level is resolved from args/env/config
+    configure_logging(use_telegraf_format=use_telegraf_format, force=True)
     
-    return args
+    return get_args()
 
 
 def ensure_basic_logging() -> None:
     """Ensures that basic logging is configured if no handlers exist."""
     if not logging.getLogger().handlers:
+        config = get_config()
         use_telegraf = config.telegraf.protocol.lower() == "execd"
         configure_logging(config.logging.level, use_telegraf)
@@ -1,23 +1,30 @@
+import asyncio
 from datetime import datetime
+import hashlib
 import os
 import sys
 import re
 import logging
 import struct
+import threading
 import zipfile
 import zlib
 from io import BytesIO
 import os.path
-from functools import lru_cache
-from influxdb_client import Point
 from lxml import etree as ET
-from loxInFlux.utils import log_performance, get_loxapp3_json_last_modified
-from loxInFlux.config import config
+from loxInFlux.utils import (
+    format_line_protocol_fields,
+    format_line_protocol_measurement,
+    format_line_protocol_tag,
+    format_line_protocol_tags,
+    get_loxapp3_json_last_modified,
+    log_performance,
+)
+from loxInFlux.config import get_config
 from loxInFlux.logger import get_lazy_logger
 import aioftp  
 import aiofiles  
 import orjson  
-from copy import deepcopy
 
 # LZ4 Import for efficient decompression
 import lz4.block as lz4b
@@ -27,6 +34,12 @@ logger = get_lazy_logger(__name__)
 
 _loxapp3_cache_json_last_modified = None
 
+# maxsize begrenzt die Anzahl der gecachten Einträge
+CONTROLS_CACHE_SIZE = 10
+_controls_cache = {}
+# getControlsFromConfigXML läuft in asyncio.to_thread-Workern, gleichzeitige Reloads dürfen sich beim Verdrängen nicht überholen
+_controls_cache_lock = threading.Lock()
+
 def _is_lz4_frame(data: bytes) -> bool:
     """
     Extended LZ4 frame detection including skippable frames.
@@ -53,6 +66,19 @@ def _decompress_loxcc_block_lz4(data: bytes, uncompressed_size: int) -> bytes:
         except Exception:
             raise ValueError(f"LZ4 decompression failed: {e}")
 
+def _lox_decompress(data: bytes, uncompressed_size: int) -> tuple[bytes, int]:
+    """
+    Decompress the payload of a LoxCC file and return it together with its CRC32.
+    The LoxCC stream is a plain LZ4 block, so the decoding runs entirely in the lz4 C extension.
+    The checksum is taken right after decoding while the buffer is still hot - lz4 does not expose
+    its output incrementally, so it cannot be folded into the decode loop itself.
+    """
+    result = _decompress_loxcc_block_lz4(data, uncompressed_size)
+    # Cheap length check first, a truncated buffer does not need to be checksummed at all
+    if len(result) != uncompressed_size:
+        raise Exception(f'Uncompressed filesize mismatch: {len(result)} != {uncompressed_size}')
+    return result, zlib.crc32(result)
+
 valueplaceholder = b'[valueplaceholder]'
 sourceplaceholder = b'[sourceplaceholder]'
 
@@ -62,41 +88,17 @@ sourceplaceholder = b'[sourceplaceholder]'
 # I don't know wether there is a way to get the current value of the control.
 SYS_BLACKLIST = ["VIRTUALTEXTIN"]
 
-def remove_bom(xmlstr: str) -> str:
-    BOM = "\ufeff"
-    return xmlstr[len(BOM):] if xmlstr.startswith(BOM) else xmlstr
+# Markup like <v.1> in Display units
+_UNIT_TAG_RE = re.compile(r'<.*?>')
 
-def correctXML_removeAttributeDuplicates(xmlstr: str, elemType: str) -> str:
-    startpos = 0
-    while True:
-        foundpos = xmlstr.find(f'<C Type="{elemType}"', startpos)
-        if foundpos == -1:
-            break
-        endpos = xmlstr.find('>', foundpos)
-        if endpos == -1:
-            break
-
-        tagstr = xmlstr[foundpos+1 : endpos]
-        attributes = re.findall(r'(\S+="[^"]*"|\S+=[^"\s]+)', tagstr)
-        newattributeArray = []
-        seen = {}
-        for attrpair in attributes:
-            parts = attrpair.split('=', 1)
-            if len(parts) != 2:
-                continue
-            attrname = parts[0]
-            if attrname in seen:
-                continue
-            seen[attrname] = True
-            newattributeArray.append(attrpair)
+# Spellings of a set Visu/VisuPwd flag as found in the config, compared directly instead of normalizing every value
+_TRUE_SET = frozenset({"1", "true", "True", "TRUE", "yes", "Yes", "YES"})
 
-        if len(newattributeArray) < len(attributes):
-            fixed = ' '.join(newattributeArray)
-            xmlstr = xmlstr[:foundpos+1] + fixed + xmlstr[endpos:]
-        startpos = foundpos + 1
-    return xmlstr
+def remove_bom(xmlstr: bytes) -> bytes:
+    BOM = b"\xef\xbb\xbf"
+    return xmlstr[len(BOM):] if xmlstr.startswith(BOM) else xmlstr
 
-def extractControls(root, lox_category_room: dict) -> tuple[dict, dict, dict]:
+def extractControls(control_elements: list, lox_category_room: dict) -> tuple[dict, dict, dict]:
     controls = {}
     visu_controls = {}
     non_visu_controls = {}
@@ -104,20 +106,34 @@ def extractControls(root, lox_category_room: dict) -> tuple[dict, dict, dict]:
     linkCofVisuControll = set()
 
     # Controls
-    for obj in root.findall('.//C[@Type]'):
-        objtype = obj.get("Type", "")
-        if objtype.upper() in config.control.type_blacklist:
-            continue  # Blacklist -> überspringen
-
-        uid = str(obj.get("U")).encode('utf-8')
-        if not uid:
+    for obj, objtype, objtype_upper in control_elements:
+        # Read every attribute only once, each lookup goes through lxml's attribute map
+        attrs = obj.attrib
+        uid_str = attrs.get("U")
+        if not uid_str:
             continue
+        uid = uid_str.encode('utf-8')
+        title = attrs.get("Title", "")
+        linkC = attrs.get("linkC")
 
         catname = ""
         rmname = ""
         visu = ""
         visuPwd = ""
-        iodata = obj.find("IoData")
+        # Collect IoData, Display and the Co subelements in one pass over the children instead of three path lookups
+        iodata = None
+        disp = None
+        subcontrols = []
+        for child in obj:
+            tag = child.tag
+            if tag == "Co":
+                subcontrols.append(child)
+            elif tag == "IoData":
+                if iodata is None:
+                    iodata = child
+            elif tag == "Display":
+                if disp is None:
+                    disp = child
         if iodata is not None:
             cr = iodata.get("Cr")
             pr = iodata.get("Pr")
@@ -129,173 +145,204 @@ def extractControls(root, lox_category_room: dict) -> tuple[dict, dict, dict]:
             visuPwd = iodata.get("VisuPwd", "")
 
         # Normalize flags to real booleans (avoid truthiness of non-empty strings like "false")
-        is_visu_control = str(visu).strip().lower() in ("1", "true", "yes")
-        is_visu_pwd_required = str(visuPwd).strip().lower() in ("1", "true", "yes")
+        is_visu_control = visu in _TRUE_SET
+        is_visu_pwd_required = visuPwd in _TRUE_SET
 
-        if is_visu_control and obj.get("linkC"):
-            linkCofVisuControll.update(e.encode('utf-8') for e in obj.get("linkC").split(","))
+        if is_visu_control and linkC:
+            linkCofVisuControll.update(e.encode('utf-8') for e in linkC.split(","))
 
         # Display-Tag -> Unit
-        disp = obj.find("Display")
         unit = ""
-        if disp is not None and disp.get("Unit"):
+        if disp is not None:
+            unit = disp.get("Unit")
             # remove <...> in der Unit
-            unit = re.sub(r'<.*?>', '', disp.get("Unit")).strip()
+            unit = _UNIT_TAG_RE.sub('', unit).strip() if unit else ""
 
         # Min/Max
-        analog = (obj.get("Analog") == "true")
+        analog = (attrs.get("Analog") == "true")
         #if not analog and obj.get("Analog"):
         #    minval, maxval = (0, 1)
         #else:
         #    minval = obj.get("MinVal", "U") if obj.get("MinVal") else "U"
         #    maxval = obj.get("MaxVal", "U") if obj.get("MaxVal") else "U"
 
-        base_point = Point.from_dict({
-                "measurement": obj.get("Title", ""),
-                "tags": {
-                    "name": obj.get("Title", ""),
-                    "description": obj.get("Desc", ""),
-                    "uuid": uid.decode('utf-8'),
-                    "statstype": int(obj.get("StatsType", 0)),
-                    "analog": 1 if analog else 0,
-                    "type": objtype,
-                    "unit": unit,
-                    "category": catname,
-                    "room": rmname,
-                    "visu": visu,
-                    "source": "[sourceplaceholder]",
-                    "application": "loxInFlux"
-                },
-                "fields": {
-                },
-            })
-
-        point = deepcopy(base_point).field("Default", "[valueplaceholder]").to_line_protocol().encode()
+        tags = {
+            "name": title,
+            "description": attrs.get("Desc", ""),
+            "uuid": uid_str,
+            "statstype": int(attrs.get("StatsType", 0)),
+            "analog": 1 if analog else 0,
+            "type": objtype,
+            "unit": unit,
+            "category": catname,
+            "room": rmname,
+            "visu": visu,
+            "source": "[sourceplaceholder]",
+            "application": "loxInFlux"
+        }
+        # Tag set rendered once per control, split at the position the subuuid tag of the subcontrols sorts into
+        tags_head = format_line_protocol_measurement(title) + format_line_protocol_tags(
+            {key: value for key, value in tags.items() if key < "subuuid"})
+        tags_tail = format_line_protocol_tags({key: value for key, value in tags.items() if key > "subuuid"})
+
+        point = tags_head + tags_tail + b" " + format_line_protocol_fields({"Default": "[valueplaceholder]"})
 
         controls[uid] = {
             "fieldkey": "Default",
             "point": point,
             "point_websocket": point.replace(b"[sourceplaceholder]", b"websocket").replace(b"[valueplaceholder]", b"")[:-2],
-            "pointInflux": deepcopy(base_point).field("Default", "[valueplaceholder]"),
-            "type": objtype.upper(),
+            "type": objtype_upper,
             "visu": is_visu_control,
             "VisuPwd": is_visu_pwd_required,
         }
         if is_visu_control:
             visu_controls[uid] = controls[uid]
-        elif objtype.upper() in SYS_BLACKLIST:
+        elif objtype_upper in SYS_BLACKLIST:
             logger.warning("Skipping %s with id %s because it is not capable of being used in the grabber", objtype, uid)
         else:
             non_visu_controls[uid] = controls[uid]
 
             # Iterate over Co subelements
-        for co in obj.findall("Co"):
-            co_uid = str(co.get("U")).encode('utf-8')
+        for co in subcontrols:
+            co_uid = co.get("U")
             if not co_uid:
                 continue
+            co_key = co.get("K", "")
             
-            point = deepcopy(base_point).tag("subuuid", co_uid.decode('utf-8')).field(co.get("K", ""), "[valueplaceholder]").to_line_protocol().encode()
+            point = (tags_head + format_line_protocol_tag("subuuid", co_uid) + tags_tail
+                     + b" " + format_line_protocol_fields({co_key: "[valueplaceholder]"}))
+            co_uid = co_uid.encode('utf-8')
             #TODO MeterDig states hinzufügen
             controls[co_uid] = {
-                "fieldkey": co.get("K", ""),
+                "fieldkey": co_key,
                 "point": point,
                 "point_websocket": point.replace(b"[sourceplaceholder]", b"websocket").replace(b"[valueplaceholder]", b"")[:-2],
-                "pointInflux": deepcopy(base_point).tag("subuuid", co_uid.decode('utf-8')).field(co.get("K", ""), "[valueplaceholder]"),
-                "type": objtype.upper(),
+                "type": objtype_upper,
                 "parent_uuid": uid,
             }
             if is_visu_control: 
                 visu_controls[co_uid] = controls[co_uid]
         
-        # Grabber needs only parent uuid
-        for uid in linkCofVisuControll:
-            if uid in non_visu_controls:
-                visu_controls[uid] = non_visu_controls[uid]
-                del non_visu_controls[uid]
+    # Grabber needs only parent uuid - promoted once after the loop, running it after every control gave the same result
+    for uid in linkCofVisuControll:
+        if uid in non_visu_controls:
+            visu_controls[uid] = non_visu_controls[uid]
+            del non_visu_controls[uid]
     return controls, visu_controls, non_visu_controls
 
 @log_performance("extractRoomsAndCategories")
-def extractRoomsAndCategories(root):
+def extractRoomsAndCategories(root) -> tuple[dict, list]:
+    """
+    Walk all C elements once, collecting the category/room names and the controls that pass the type blacklist.
+    The controls are only extracted afterwards since they may reference categories and rooms defined later on.
+    """
     lox_category_room = {}
-
-    # Kategorien und Räume
-    for elem in root.xpath('.//C[@Type="Category" or @Type="Place"]'):
-        uid = elem.get("U")
-        if uid:
-            lox_category_room[uid] = elem.get("Title", "")
+    control_elements = []
+    type_blacklist = get_config().control.type_blacklist
+    # Types repeat a lot, upper-case each one only once
+    upper_types = {}
+
+    for elem in root.iterdescendants('C'):
+        objtype = elem.get("Type")
+        if objtype is None:
+            continue
+        # Kategorien und Räume
+        if objtype == "Category" or objtype == "Place":
+            uid = elem.get("U")
+            if uid:
+                lox_category_room[uid] = elem.get("Title", "")
+        objtype_upper = upper_types.get(objtype)
+        if objtype_upper is None:
+            objtype_upper = upper_types[objtype] = objtype.upper()
+        if objtype_upper in type_blacklist:
+            continue  # Blacklist -> überspringen
+        control_elements.append((elem, objtype, objtype_upper))
     logger.debug("lox_category_room: %s", lox_category_room)
-    return lox_category_room
+    return lox_category_room, control_elements
 
 def readXMLstring(xml_path: str):
     if not os.path.exists(xml_path):
         print(f"Fehler: {xml_path} nicht gefunden.")
         sys.exit(1)
 
-    with open(xml_path, "r", encoding="utf-8", errors="replace") as f:
+    with open(xml_path, "rb") as f:
         xmlstr = f.read()
     return xmlstr
 
-@lru_cache(maxsize=10)  # maxsize begrenzt die Anzahl der gecachten Einträge
-@log_performance("getControlsFromConfigXML")
-def getControlsFromConfigXML(xmlstr: str):
-    xmlstr = remove_bom(xmlstr)
-    xmlstr = correctXML_removeAttributeDuplicates(xmlstr, "(LoxAIR|LoxAIRDevice|User)")
-    
-    try:    
-        root = ET.fromstring(xmlstr.encode('utf-8'))
-        logger.debug("XML parsed successfully")
-    except ET.XMLSyntaxError as e:
-        logger.warning("Standard XML parsing failed: %s", str(e))
-        logger.warning("Attempting XML parsing with recovery mode for malformed XML")
-        
-        # Use lxml recovery mode for malformed XML (handles duplicate attributes, encoding issues, etc.)
-        parser = ET.XMLParser(recover=True)
-        root = ET.fromstring(xmlstr.encode('utf-8'), parser)
-        logger.warning("Successfully parsed malformed XML using lxml recovery mode")
+def getControlsFromConfigXML(xmlstr: bytes):
+    # Cache keyed by a digest of the document, so the cache does not keep whole multi-MB documents alive
+    key = hashlib.blake2b(xmlstr, digest_size=16).digest()
+    with _controls_cache_lock:
+        result = _controls_cache.get(key)
+    if result is None:
+        # Parsed outside the lock, it only guards the dict itself
+        result = _extractControlsFromConfigXML(xmlstr)
+        with _controls_cache_lock:
+            if key not in _controls_cache:
+                while len(_controls_cache) >= CONTROLS_CACHE_SIZE:
+                    # Drop the oldest entry
+                    del _controls_cache[next(iter(_controls_cache))]
+                _controls_cache[key] = result
+    return result
 
+@log_performance("getControlsFromConfigXML")
+def _extractControlsFromConfigXML(xmlstr: bytes):
+    # The document stays bytes end to end, lxml decodes it itself according to the XML declaration.
+    # The Loxone config is known to be malformed (duplicate attributes of LoxAIR/LoxAIRDevice/User entries, encoding issues),
+    # so parse in recovery mode right away instead of pre-scanning the document or parsing it twice.
+    parser = ET.XMLParser(recover=True, huge_tree=True)
+    root = ET.fromstring(remove_bom(xmlstr), parser)
+    if parser.error_log:
+        logger.debug("Recovered from %d XML errors, first: %s", len(parser.error_log), parser.error_log[0])
+    logger.debug("XML parsed successfully")
+
+    lox_category_room, control_elements = extractRoomsAndCategories(root)
     
-    lox_category_room = extractRoomsAndCategories(root)
-    
-    return extractControls(root, lox_category_room)
+    return extractControls(control_elements, lox_category_room)
 
 def parseAndGetControls(xml_path: str):
     xmlstr = readXMLstring(xml_path)
     return getControlsFromConfigXML(xmlstr)
 
 
-async def load_miniserver_config(ip: str, username: str, password: str, persist: bool = False, use_cache: bool = True) -> tuple[str, dict]:
+async def load_miniserver_config(ip: str, username: str, password: str, persist: bool = False, use_cache: bool = True) -> tuple[bytes, dict]:
     """
     Load the most recent version of the currently active configuration file
     and LoxAPP3.json from the Miniserver via FTP.
     
     Returns:
-        tuple[str, dict]: A tuple containing (config_content, loxapp3_json)
+        tuple[bytes, dict]: A tuple containing (config_content, loxapp3_json)
     """
     global _loxapp3_cache_json_last_modified
+    data_dir = get_config().paths.data_dir
     try:
         # Check cache first if enabled
-        if use_cache and _loxapp3_cache_json_last_modified and _loxapp3_cache_json_last_modified >= get_loxapp3_json_last_modified():
-            cached_files = [f for f in os.listdir(config.paths.data_dir) 
-                          if f.startswith('sps_') and f.endswith('.xml')]
-            if cached_files:
-                latest_cache = sorted(cached_files)[-1]
-                cached_xml = os.path.join(config.paths.data_dir, latest_cache)
-                cached_json = os.path.join(config.paths.data_dir, 'LoxAPP3.json')
+        miniserver_last_modified = await get_loxapp3_json_last_modified() if use_cache and _loxapp3_cache_json_last_modified else None
+        if miniserver_last_modified is not None and _loxapp3_cache_json_last_modified >= miniserver_last_modified:
+            # Single pass over the data dir - the sps_ names sort chronologically, so the greatest one is the latest
+            latest_cache = None
+            with os.scandir(data_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('sps_') and name.endswith('.xml') and (latest_cache is None or name > latest_cache):
+                        latest_cache = name
+            cached_xml = os.path.join(data_dir, latest_cache) if latest_cache else None
+            cached_json = os.path.join(data_dir, 'LoxAPP3.json')
+
+            if cached_xml and os.path.exists(cached_json):
+                logger.info("Using cached configuration from %s", cached_xml)
+                logger.info("Using cached LoxAPP3.json from %s", cached_json)
                 
-                if os.path.exists(cached_xml) and os.path.exists(cached_json):
-                    logger.info("Using cached configuration from %s", cached_xml)
-                    logger.info("Using cached LoxAPP3.json from %s", cached_json)
-                    
-                    async with aiofiles.open(cached_json, 'rb') as f:
-                        json_content = orjson.loads(await f.read())
-                        _loxapp3_cache_json_last_modified = datetime.strptime(json_content["lastModified"], "%Y-%m-%d %H:%M:%S")
-                    if _loxapp3_cache_json_last_modified >= get_loxapp3_json_last_modified():
-                        async with aiofiles.open(cached_xml, 'r', encoding='utf-8') as f:
-                            config_content = await f.read()
-                        return config_content, json_content
-                else:
-                    logger.info("No cached configuration files found. Downloading new version.")
-                    _loxapp3_cache_json_last_modified = None
+                async with aiofiles.open(cached_json, 'rb') as f:
+                    json_content = orjson.loads(await f.read())
+                    _loxapp3_cache_json_last_modified = datetime.strptime(json_content["lastModified"], "%Y-%m-%d %H:%M:%S")
+                if _loxapp3_cache_json_last_modified >= miniserver_last_modified:
+                    async with aiofiles.open(cached_xml, 'rb') as f:
+                        config_content = await f.read()
+                    return config_content, json_content
+            else:
+                logger.info("No cached configuration files found. Downloading new version.")
+                _loxapp3_cache_json_last_modified = None
 
         # Connect using aioftp
         async with aioftp.Client.context(ip, user=username, password=password) as client:
@@ -316,54 +363,56 @@ async def load_miniserver_config(ip: str, username: str, password: str, persist:
             filename = sorted(filelist)[-1]
             logger.info("Selected configuration file: %s", filename)
             
-            # Download the file
-            download_file = BytesIO()
+            # Download the file - collect the blocks and join them once, BytesIO then wraps the joined bytes without copying
+            blocks = []
             async with client.download_stream(f"/prog/{filename}") as stream:
                 async for block in stream.iter_by_block():
-                    download_file.write(block)
-            
-            download_file.seek(0)
+                    blocks.append(block)
+            download_file = BytesIO(b"".join(blocks))
+            del blocks
 
             # Extract and decompress the configuration
             zf = zipfile.ZipFile(download_file)
-            with zf.open('sps0.LoxCC') as f:
-                header, = struct.unpack('<L', f.read(4))
-                if header != 0xaabbccee:
-                    raise Exception("Invalid file format")
-                    
-                compressedSize, uncompressedSize, checksum, = struct.unpack('<LLL', f.read(12))
-                data = f.read(compressedSize)
-                
-                # Strict payload length validation
-                if len(data) != compressedSize:
-                    raise Exception(f"Payload length mismatch: got {len(data)}, expected {compressedSize}")
+            # Read the member once and parse it in place - the payload is handed to lz4 as a view instead of a copy
+            loxcc = zf.read('sps0.LoxCC')
+            header, = struct.unpack_from('<L', loxcc)
+            if header != 0xaabbccee:
+                raise Exception("Invalid file format")
                 
-                # Decompress using LZ4 library (much faster than manual implementation)
-                logger.debug("Using LZ4 decompression")
-                resultStr = _decompress_loxcc_block_lz4(data, uncompressedSize)
-                        
-                if checksum != zlib.crc32(resultStr):
-                    raise Exception('Checksum verification failed')
-                    
-                if len(resultStr) != uncompressedSize:
-                    raise Exception(f'Uncompressed filesize mismatch: {len(resultStr)} != {uncompressedSize}')
-                    
-                config_content = resultStr.decode('utf-8')
+            compressedSize, uncompressedSize, checksum, = struct.unpack_from('<LLL', loxcc, 4)
+            data = memoryview(loxcc)[16:16 + compressedSize]
             
+            # Strict payload length validation
+            if len(data) != compressedSize:
+                raise Exception(f"Payload length mismatch: got {len(data)}, expected {compressedSize}")
+            
+            # Decompress using LZ4 library (much faster than manual implementation)
+            # Decoding and checksumming are CPU bound - run them off the event loop so websocket traffic keeps flowing
+            logger.debug("Using LZ4 decompression")
+            resultStr, crc = await asyncio.to_thread(_lox_decompress, data, uncompressedSize)
+                    
+            if checksum != crc:
+                raise Exception('Checksum verification failed')
+                
+            config_content = resultStr
+            del data, loxcc
+        
             # Get the LoxAPP3.json content
             with zf.open('LoxAPP3.json') as f:
-                json_content = orjson.loads(f.read())
+                json_bytes = f.read()
+            json_content = orjson.loads(json_bytes)
             
             # Save both files if persist is enabled
             if persist:
-                output_xml = os.path.join(config.paths.data_dir, 
+                output_xml = os.path.join(data_dir, 
                                         f'{filename.replace(".zip", "").replace(".LoxCC", "")}.xml')
-                output_json = os.path.join(config.paths.data_dir, 'LoxAPP3.json')
+                output_json = os.path.join(data_dir, 'LoxAPP3.json')
                 
-                async with aiofiles.open(output_xml, 'w', encoding='utf-8') as f:
+                async with aiofiles.open(output_xml, 'wb') as f:
                     await f.write(config_content)
                 async with aiofiles.open(output_json, 'wb') as f:
-                    await f.write(orjson.dumps(json_content))
+                    # Persist the file as downloaded, no need to serialize the parsed content again
+                    await f.write(json_bytes)
                     
                 logger.info("Configuration saved to %s", output_xml)
                 logger.info("LoxAPP3.json saved to %s", output_json)
@@ -372,5 +421,5 @@ async def load_miniserver_config(ip: str, username: str, password: str, persist:
             return config_content, json_content
                     
     except Exception as e:
-        logger.error("Error loading miniserver configuration: %s", str(e))
+        logger.error("Error loading miniserver configuration: %s", e)
         raise
\ No newline at end of file
@@ -1,37 +1,69 @@
-import abc
 import asyncio
 import logging
+import os
+import socket
+import stat
+from collections import deque
 from typing import Optional
-from .config import config
+from .config import get_config
 from .logger import get_lazy_logger
-import sys
 from gmqtt import Client as MQTTClient
 from gmqtt import constants as MQTTconstants
 
 logger = get_lazy_logger(__name__)
 
-class TelegrafWriter(abc.ABC):
-    """Abstract base class for Telegraf writers."""
+# Payload limit per UDP datagram - keeps packed points within a single Ethernet frame
+UDP_MAX_DATAGRAM_SIZE = 1400
+# Number of full datagrams pending points are collected for before they are sent right away
+UDP_BATCH_DATAGRAMS = 32
+# Maximum time in seconds a point waits for more points to share its datagrams with
+UDP_FLUSH_INTERVAL = 0.001
+# Send buffer requested for the pooled UDP sockets
+UDP_SEND_BUFFER_SIZE = 4 * 1024 * 1024
+# Pending bytes kept while the UDP socket is gone, the oldest points are dropped beyond it
+UDP_MAX_PENDING_BYTES = 4 * 1024 * 1024
+# First and maximum delay in seconds between UDP reconnect attempts, doubled after every failed attempt
+UDP_RECONNECT_DELAY = 1.0
+UDP_RECONNECT_MAX_DELAY = 60.0
+# Buffered TCP bytes that trigger an immediate write
+TCP_WRITE_BUFFER_SIZE = 64 * 1024
+# Interval in seconds partially filled TCP buffers are written in
+TCP_FLUSH_INTERVAL = 1.0
+# Buffered TCP bytes kept while disconnected from Telegraf, the oldest points are dropped beyond it
+TCP_MAX_BUFFER_SIZE = 4 * 1024 * 1024
+# First and maximum delay in seconds between TCP reconnect attempts, doubled after every failed attempt
+TCP_RECONNECT_DELAY = 1.0
+TCP_RECONNECT_MAX_DELAY = 60.0
+# Interval in seconds buffered points are published to MQTT in
+MQTT_FLUSH_INTERVAL = 0.05
+# Buffered MQTT bytes kept while disconnected from the broker, the oldest points are dropped beyond it
+MQTT_MAX_BUFFER_SIZE = 4 * 1024 * 1024
+# First and maximum delay in seconds between MQTT reconnect attempts, doubled after every failed attempt
+MQTT_RECONNECT_DELAY = 1.0
+MQTT_RECONNECT_MAX_DELAY = 60.0
+# File descriptor the ExecD writer emits its points on
+STDOUT_FD = 1
+
+class TelegrafWriter:
+    """Base class for Telegraf writers."""
+
+    __slots__ = ()
     
-    @abc.abstractmethod
     async def initialize(self):
-        """Initialize the connection."""
-        pass
-    
-    @abc.abstractmethod
-    async def connect(self) -> None:
-        """Create connection to Telegraf."""
-        pass
+        """Create the connection to Telegraf if not already initialized."""
+        raise NotImplementedError
         
-    @abc.abstractmethod
     async def close(self) -> None:
         """Close the connection."""
-        pass
+        raise NotImplementedError
         
-    @abc.abstractmethod
     async def write(self, point: bytes) -> None:
         """Write a point to Telegraf."""
-        pass
+        raise NotImplementedError
+
+    async def write_many(self, points: list[bytes]) -> None:
+        """Write several points to Telegraf in one go."""
+        await self.write(b"\n".join(points))
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -42,138 +74,515 @@ class TelegrafWriter(abc.ABC):
         """Async context manager exit."""
         await self.close()
 
+class _SharedUDPSocket:
+    """Connected, non-blocking UDP socket shared by all UDPTelegrafWriters sending to the same Telegraf address."""
+
+    __slots__ = ('key', 'sock', 'refs', 'backlog', 'refused')
+
+    def __init__(self, key: tuple[str, int], sock: socket.socket):
+        self.key = key
+        self.sock = sock
+        self.refs = 0
+        # Datagrams the socket buffer had no room for, sent in order once the socket is writable again
+        self.backlog = deque()
+        # Datagrams lost to ConnectionRefusedError, the total shows up in the debug log
+        self.refused = 0
+
+    @classmethod
+    async def acquire(cls, host: str, port: int) -> '_SharedUDPSocket':
+        """Return the pooled socket for host and port, creating it on first use."""
+        key = (host, port)
+        shared = _udp_sockets.get(key)
+        if shared is None:
+            loop = asyncio.get_running_loop()
+            family, type_, proto, _, address = (await loop.getaddrinfo(host, port, type=socket.SOCK_DGRAM))[0]
+            sock = socket.socket(family, type_, proto)
+            try:
+                if hasattr(socket, "SO_REUSEPORT"):  # Not available on every platform
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                # Room for bursts, the kernel caps it at net.core.wmem_max
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SEND_BUFFER_SIZE)
+                sock.setblocking(False)
+                # Connecting a UDP socket only sets the default destination, it never blocks
+                sock.connect(address)
+            except OSError:
+                sock.close()
+                raise
+            # Another writer may have created the socket while the address was resolved
+            shared = _udp_sockets.get(key)
+            if shared is None:
+                shared = _udp_sockets[key] = cls(key, sock)
+            else:
+                sock.close()
+        shared.refs += 1
+        return shared
+
+    def release(self) -> None:
+        """Drop one reference, the last one closes the socket."""
+        self.refs -= 1
+        if self.refs > 0:
+            return
+        self.discard()
+        if self.backlog:
+            asyncio.get_running_loop().remove_writer(self.sock.fileno())
+            logger.warning("Dropping %d UDP datagrams the socket had no room for", len(self.backlog))
+            self.backlog.clear()
+        self.sock.close()
+
+    def discard(self) -> None:
+        """Remove the socket from the pool, writers acquiring afterwards get a fresh one."""
+        if _udp_sockets.get(self.key) is self:
+            del _udp_sockets[self.key]
+
+    def send_datagrams(self, datagrams: list[bytes]) -> None:
+        """Send the datagrams straight on the socket, queueing the rest in the backlog once its buffer is full."""
+        if self.backlog:
+            # Still waiting for the socket to become writable, keep the order
+            self.backlog.extend(datagrams)
+            return
+        send = self.sock.send
+        for i, datagram in enumerate(datagrams):
+            try:
+                send(datagram)
+            except BlockingIOError:
+                self.backlog.extend(datagrams[i:])
+                asyncio.get_running_loop().add_writer(self.sock.fileno(), self._drain_backlog)
+                return
+            except ConnectionRefusedError:
+                # ICMP port unreachable for an earlier datagram, Telegraf is not listening (yet). The error is
+                # reported instead of sending this datagram, so it is lost as well - counted and skipped
+                self._count_refused()
+
+    def _drain_backlog(self) -> None:
+        """Writer callback, sends the backlog until the socket buffer is full again or the backlog is empty."""
+        backlog = self.backlog
+        send = self.sock.send
+        try:
+            while backlog:
+                try:
+                    send(backlog[0])
+                except BlockingIOError:
+                    return
+                except ConnectionRefusedError:
+                    # As in send_datagrams, the datagram was not sent
+                    self._count_refused()
+                backlog.popleft()
+        except OSError as e:
+            backlog.clear()
+            logger.error("Failed to write to Telegraf: %s", e)
+            self.discard()
+        asyncio.get_running_loop().remove_writer(self.sock.fileno())
+
+    def _count_refused(self) -> None:
+        """Count a datagram lost to ConnectionRefusedError and log the total so far."""
+        self.refused += 1
+        logger.debug("Telegraf refused UDP datagram at %s:%d, %d datagrams lost so far", *self.key, self.refused)
+
+# Connected UDP sockets by Telegraf address, shared by all writers sending there
+_udp_sockets: dict[tuple[str, int], _SharedUDPSocket] = {}
+
 class UDPTelegrafWriter(TelegrafWriter):
+    __slots__ = ('host', 'port', '_sock', '_send', '_initialized', '_pending', '_pending_bytes',
+                 '_flush_handle', '_reconnect_task')
+
     def __init__(self):
         """Initialize the UDP Telegraf writer with connection details."""
+        config = get_config()
         self.host = config.telegraf.host
         self.port = config.telegraf.port
-        self.transport = None
+        self._sock = None
+        # send_datagrams of the pooled socket, bound once so datagrams skip the transport buffering
+        self._send = None
         self._initialized = False
+        # Points waiting to be packed into datagrams, sent once UDP_BATCH_DATAGRAMS are full or UDP_FLUSH_INTERVAL passed
+        self._pending = []
+        self._pending_bytes = 0
+        self._flush_handle = None
+        self._reconnect_task = None
 
     async def initialize(self):
-        """Initialize the UDP connection if not already initialized."""
+        """Get the connected, non-blocking UDP socket to Telegraf from the pool if not already initialized."""
         if not self._initialized:
-            await self.connect()
+            try:
+                self._sock = await _SharedUDPSocket.acquire(self.host, self.port)
+                self._send = self._sock.send_datagrams
+                logger.info("Created UDP socket for Telegraf at %s:%d", self.host, self.port)
+            except Exception as e:
+                logger.error("Failed to create UDP socket for Telegraf: %s", e)
+                raise
             self._initialized = True
+            if self._pending:
+                self._schedule_flush()
         return self
 
-    async def connect(self) -> None:
-        """Create UDP connection to Telegraf."""
-        try:
-            loop = asyncio.get_running_loop()
-            transport, _ = await loop.create_datagram_endpoint(
-                lambda: asyncio.DatagramProtocol(),
-                remote_addr=(self.host, self.port)
-            )
-            self.transport = transport
-            logger.info("Created UDP endpoint for Telegraf at %s:%d", self.host, self.port)
-        except Exception as e:
-            logger.error("Failed to create UDP endpoint for Telegraf: %s", e)
-            raise
-
     async def close(self) -> None:
         """Close the UDP connection."""
-        if self.transport:
+        if self._sock:
             try:
-                self.transport.close()
+                self._flush()
+                self._sock.release()
                 logger.info("Closed UDP connection to Telegraf")
             except Exception as e:
                 logger.error("Error closing Telegraf connection: %s", e)
+            self._sock = None
+            self._send = None
         self._initialized = False
         
     async def write(self, point: bytes) -> None:
+        self._pending.append(point)
+        self._pending_bytes += len(point) + 1
+        self._schedule_flush()
+
+    async def write_many(self, points: list[bytes]) -> None:
+        """Queue several points, they are packed into datagrams on the next flush."""
+        self._pending.extend(points)
+        self._pending_bytes += sum(map(len, points)) + len(points)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush right away once enough points for a full batch of datagrams are pending, otherwise arm the flush timer."""
+        if self._pending_bytes >= UDP_BATCH_DATAGRAMS * UDP_MAX_DATAGRAM_SIZE:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(UDP_FLUSH_INTERVAL, self._flush)
+
+    def _flush(self) -> None:
+        """Send all pending points, packed into as few datagrams as UDP_MAX_DATAGRAM_SIZE allows.
+
+        A single point is never split, so a point larger than the limit is sent on its own.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        points = self._pending
+        if not points:
+            return
+        if self._send is None:
+            # Not connected (yet) - the points wait for the flush after (re)connecting
+            self._trim_pending()
+            return
+        self._pending = []
+        self._pending_bytes = 0
+        datagrams = []
+        datagram = []
+        size = 0
+        for point in points:
+            if datagram and size + len(point) > UDP_MAX_DATAGRAM_SIZE:
+                datagrams.append(b"\n".join(datagram))
+                datagram = []
+                size = 0
+            datagram.append(point)
+            size += len(point) + 1
+        datagrams.append(b"\n".join(datagram))
         try:
-            self.transport.sendto(point)
-        except Exception as e:
+            self._send(datagrams)
+        except OSError as e:
             logger.error("Failed to write to Telegraf: %s", e)
-            # Try to reconnect
-            await self.close()
-            await self.initialize()
+            # Writers reconnecting afterwards get a fresh socket instead of the failing one
+            self._sock.discard()
+            self._schedule_reconnect()
+
+    def _trim_pending(self) -> None:
+        """Drop the oldest pending points once UDP_MAX_PENDING_BYTES are exceeded, down to three quarters of it so
+        this doesn't run again on the very next write."""
+        if self._pending_bytes <= UDP_MAX_PENDING_BYTES:
+            return
+        points = self._pending
+        excess = self._pending_bytes - UDP_MAX_PENDING_BYTES * 3 // 4
+        dropped = 0
+        while excess > 0:
+            excess -= len(points[dropped]) + 1
+            dropped += 1
+        del points[:dropped]
+        self._pending_bytes = sum(map(len, points)) + len(points)
+        logger.warning("Dropped %d points while not connected to Telegraf", dropped)
+
+    def _schedule_reconnect(self) -> None:
+        """Reconnect in the background - sends run from loop callbacks, so this can't be awaited there."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Close and reopen the socket, retrying with growing delays until it succeeds."""
+        await self.close()
+        delay = UDP_RECONNECT_DELAY
+        while True:
+            try:
+                await self.initialize()
+                return
+            except Exception as e:
+                logger.error("Reconnecting to Telegraf failed, retrying in %.1fs: %s", delay, e)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, UDP_RECONNECT_MAX_DELAY)
+
+class _TelegrafClientProtocol(asyncio.Protocol):
+    """Write-only protocol for the TCP writer - Telegraf never answers on its socket listener, so there is no reader."""
+
+    def __init__(self):
+        self.transport = None
+        self._paused = False
+        # One future per drain() caller, the periodic flush and a write over the threshold may wait at the same time
+        self._drain_waiters = deque()
+        self._closed = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        if exc:
+            logger.warning("Lost TCP connection to Telegraf: %s", exc)
+        self._paused = False
+        self._wake_drain_waiters()
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        self._wake_drain_waiters()
+
+    def _wake_drain_waiters(self):
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def drain(self) -> None:
+        """Wait until the transport buffer dropped below its high-water mark again - returns right away if it never got there."""
+        if self._paused:
+            waiter = asyncio.get_running_loop().create_future()
+            self._drain_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                self._drain_waiters.remove(waiter)
+        if self._closed.done():
+            raise ConnectionResetError("Connection to Telegraf lost")
+
+    async def wait_closed(self) -> None:
+        await self._closed
 
 class TCPTelegrafWriter(TelegrafWriter):
+    # write/write_many are slots holding the bound variant for the current connection state
+    __slots__ = ('host', 'port', 'max_retries', 'transport', '_protocol', '_initialized', '_wbuf', '_flush_task',
+                 '_flush_lock', '_reconnect_at', '_reconnect_delay', 'write', 'write_many')
+
     def __init__(self):
         """Initialize the TCP Telegraf writer with connection details."""
+        config = get_config()
         self.host = config.telegraf.host
         self.port = config.telegraf.port
         self.max_retries = config.telegraf.max_retries
-        self.writer = None
-        self.reader = None
+        self.transport = None
+        self._protocol = None
         self._initialized = False
+        # Newline terminated points, handed to the socket once TCP_WRITE_BUFFER_SIZE is reached or by the periodic flush
+        self._wbuf = bytearray()
+        self._flush_task = None
+        # Serializes _flush_buffer between the periodic flush and writes over the threshold, so a failing write
+        # puts its data back only once
+        self._flush_lock = asyncio.Lock()
+        # Loop time of the next reconnect attempt by the periodic flush and the delay after that one
+        self._reconnect_at = 0.0
+        self._reconnect_delay = TCP_RECONNECT_DELAY
+        self._use_uninitialized_writes()
+
+    def _use_uninitialized_writes(self) -> None:
+        """Route writes through the variants that connect first. Once initialized, write/write_many are switched to
+        the variants that skip the initialization check entirely."""
+        self.write = self._write_uninitialized
+        self.write_many = self._write_many_uninitialized
 
     async def initialize(self):
-        """Initialize the TCP connection if not already initialized."""
+        """Create the TCP connection to Telegraf if not already initialized, max_retries 0 retries indefinitely."""
         if not self._initialized:
-            await self.connect()
-            self._initialized = True
+            attempt = 0
+            while True:
+                try:
+                    await self._connect()
+                    break
+                except Exception:
+                    attempt += 1
+                    if 0 < self.max_retries <= attempt:
+                        raise
+                    await asyncio.sleep(1)
         return self
 
-    async def connect(self) -> None:
-        """Create TCP connection to Telegraf."""
-        for attempt in range(1,self.max_retries):
-            try:
-                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
-                logger.info("Created TCP connection to Telegraf at %s:%d", self.host, self.port)
-                return
-            except Exception as e:
-                logger.error("Failed to create TCP connection to Telegraf: %s", e)
-                if self.max_retries > 0 and attempt > self.max_retries:
-                    raise
-                await asyncio.sleep(1)
+    async def _connect(self) -> None:
+        """Make a single connection attempt, switching the writes to their initialized variants on success."""
+        try:
+            self.transport, self._protocol = await asyncio.get_running_loop().create_connection(
+                _TelegrafClientProtocol, self.host, self.port)
+            logger.info("Created TCP connection to Telegraf at %s:%d", self.host, self.port)
+        except Exception as e:
+            logger.error("Failed to create TCP connection to Telegraf: %s", e)
+            raise
+        self._initialized = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._periodic_flush())
+        self.write = self._write_initialized
+        self.write_many = self._write_many_initialized
 
     async def close(self) -> None:
-        """Close the TCP connection."""
-        if self.writer:
+        """Close the TCP connection, flushing the buffered points first."""
+        if self._flush_task:
+            self._flush_task.cancel()
             try:
-                self.writer.close()
-                await self.writer.wait_closed()
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._wbuf and not self._initialized:
+            # Lost the connection earlier - one last attempt to hand over what is still buffered
+            try:
+                await self._connect()
+            except Exception:
+                pass
+        if self.transport:
+            await self._flush_buffer()
+        if self._wbuf:
+            logger.warning("Dropping %d buffered bytes, not connected to Telegraf", len(self._wbuf))
+            self._wbuf.clear()
+        await self._close_connection()
+        self._initialized = False
+        self._use_uninitialized_writes()
+
+    async def _close_connection(self) -> None:
+        if self.transport:
+            try:
+                self.transport.close()
+                await self._protocol.wait_closed()
                 logger.info("Closed TCP connection to Telegraf")
             except Exception as e:
                 logger.error("Error closing Telegraf connection: %s", e)
-        self._initialized = False
+            self.transport = None
+            self._protocol = None
         
-    async def write(self, point: bytes) -> None:
+    async def _write_initialized(self, point: bytes) -> None:
         """Write a point to Telegraf via TCP.
         
         Args:
             point: InfluxDB Point to write
         """
-        if not self._initialized:
-            await self.initialize()
-            
         if point:
+            self._wbuf += point
+            self._wbuf += b"\n"
+            if len(self._wbuf) >= TCP_WRITE_BUFFER_SIZE:
+                await self._flush_buffer()
+
+    async def _write_many_initialized(self, points: list[bytes]) -> None:
+        """Write several points to Telegraf via TCP."""
+        wbuf = self._wbuf
+        for point in points:
+            wbuf += point
+            wbuf += b"\n"
+        if len(wbuf) >= TCP_WRITE_BUFFER_SIZE:
+            await self._flush_buffer()
+
+    async def _write_uninitialized(self, point: bytes) -> None:
+        await self.initialize()
+        await self._write_initialized(point)
+
+    async def _write_many_uninitialized(self, points: list[bytes]) -> None:
+        await self.initialize()
+        await self._write_many_initialized(points)
+
+    async def _periodic_flush(self):
+        """Periodically flush the buffer."""
+        while True:
             try:
-                self.writer.write(point)
-                await self.writer.drain()
+                await asyncio.sleep(TCP_FLUSH_INTERVAL)
+                if not self._initialized:
+                    await self._reconnect()
+                await self._flush_buffer()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Error in periodic flush: %s", e)
+
+    async def _flush_buffer(self):
+        """Hand the buffered points to the transport in one write, only waiting if its buffer is above the high-water mark."""
+        async with self._flush_lock:
+            if not self._wbuf:
+                return
+            if not self._initialized:
+                # Disconnected - the points wait for the periodic flush to reconnect
+                self._trim_buffer()
+                return
+            # Swap in a fresh buffer - the old one can be handed over without copying as it is never touched again
+            data, self._wbuf = self._wbuf, bytearray()
+            try:
+                if self.transport.is_closing():
+                    raise ConnectionResetError("Connection to Telegraf lost")
+                self.transport.write(data)
+                await self._protocol.drain()
             except Exception as e:
                 logger.error("Failed to write to Telegraf: %s", e)
-                # Try to reconnect
-                await self.close()
-                await self.initialize()
+                # Put the batch back in front of what was written meanwhile, the periodic flush reconnects and resends it.
+                # Concatenated into a new buffer, the transport may still hold a view of data
+                self._wbuf = data + self._wbuf
+                self._trim_buffer()
+                self._initialized = False
+                self._reconnect_at = 0.0
+                await self._close_connection()
+
+    async def _reconnect(self) -> None:
+        """Try to reconnect once the delay after the last failed attempt passed, the delay doubles per failure."""
+        now = asyncio.get_running_loop().time()
+        if now < self._reconnect_at:
+            return
+        try:
+            await self._connect()
+            self._reconnect_delay = TCP_RECONNECT_DELAY
+        except Exception:
+            # _connect() already logged the cause
+            self._reconnect_at = now + self._reconnect_delay
+            self._reconnect_delay = min(self._reconnect_delay * 2, TCP_RECONNECT_MAX_DELAY)
+
+    def _trim_buffer(self) -> None:
+        """Drop the oldest complete points beyond TCP_MAX_BUFFER_SIZE while there is no connection to write them on."""
+        wbuf = self._wbuf
+        excess = len(wbuf) - TCP_MAX_BUFFER_SIZE
+        if excess <= 0:
+            return
+        end = wbuf.find(b"\n", excess - 1) + 1 or len(wbuf)
+        dropped = wbuf.count(b"\n", 0, end)
+        del wbuf[:end]
+        logger.warning("Dropped %d points while disconnected from Telegraf", dropped)
 
 class ExecDTelegrafWriter(TelegrafWriter):
     """Writer that outputs metrics to stdout for Telegraf execd input plugin."""
+
+    __slots__ = ('_initialized', '_buffer', '_buffer_size', '_max_buffer_size', '_flush_task', '_fd', '_draining',
+                 '_head_in_flight', '_dropped')
     
     def __init__(self):
         """Initialize the ExecD writer."""
         self._initialized = False
-        self._buffer = []
-        self._buffer_size = 5000  # Max number of points to buffer
+        # Newline terminated points, shipped as is by _flush_buffer
+        self._buffer = bytearray()
+        self._buffer_size = 1024 * 1024  # Buffered bytes that trigger an immediate flush
+        # Upper bound while stdout doesn't keep up - the oldest points are dropped beyond it
+        self._max_buffer_size = 16 * 1024 * 1024
         self._flush_task = None
-        # Ensure stdout is not buffered
-        sys.stdout.reconfigure(line_buffering=True)
+        # Descriptor the points are written to, see _open_stdout
+        self._fd = STDOUT_FD
+        # Whether a writer callback waits for stdout to accept the rest of the buffer
+        self._draining = False
+        # Whether the first line of the buffer was already written in part and must not be dropped
+        self._head_in_flight = False
+        self._dropped = 0
 
     async def initialize(self):
         """Initialize the writer and start flush task."""
         if not self._initialized:
             self._initialized = True
+            self._fd = self._open_stdout()
             self._flush_task = asyncio.create_task(self._periodic_flush())
             logger.info("Initialized ExecD writer")
         return self
 
-    async def connect(self) -> None:
-        """No connection needed for ExecD writer."""
-        pass
-
     async def close(self) -> None:
         """Close the writer and flush remaining points."""
         if self._flush_task:
@@ -182,31 +591,103 @@ class ExecDTelegrafWriter(TelegrafWriter):
                 await self._flush_task
             except asyncio.CancelledError:
                 pass
-        await self._flush_buffer()
+        if self._draining:
+            asyncio.get_running_loop().remove_writer(self._fd)
+            self._draining = False
+        # Nothing else runs anymore, so wait for stdout to take the rest
+        os.set_blocking(self._fd, True)
+        self._write_available()
+        self._log_dropped()
+        if self._fd != STDOUT_FD:
+            os.close(self._fd)
+            self._fd = STDOUT_FD
         self._initialized = False
+
+    @staticmethod
+    def _open_stdout() -> int:
+        """Return a non-blocking descriptor for stdout, so a stalled Telegraf doesn't block the event loop.
+
+        O_NONBLOCK belongs to the open file description, which stdout often shares with stderr (tty, 2>&1) - setting
+        it on fd 1 would make logging and print() raise BlockingIOError. Pipes and terminals are therefore reopened
+        as a description of their own. Anything else (regular files never block) keeps using fd 1 in blocking mode.
+        """
+        mode = os.fstat(STDOUT_FD).st_mode
+        if stat.S_ISFIFO(mode) or stat.S_ISCHR(mode):
+            try:
+                return os.open(f"/proc/self/fd/{STDOUT_FD}", os.O_WRONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+            except OSError as e:
+                logger.warning("Could not reopen stdout non-blocking, writing to it blocking: %s", e)
+        os.set_blocking(STDOUT_FD, True)
+        return STDOUT_FD
     
     async def _periodic_flush(self):
         """Periodically flush the buffer."""
         while True:
             try:
                 await asyncio.sleep(1.0)  # Flush every second
-                await self._flush_buffer()
+                self._flush_buffer()
+                self._log_dropped()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Error in periodic flush: %s", e)
 
-    async def _flush_buffer(self):
-        """Flush the current buffer to stdout."""
+    def _log_dropped(self):
+        if self._dropped:
+            logger.warning("Dropped %d points because stdout did not keep up", self._dropped)
+            self._dropped = 0
+
+    def _flush_buffer(self):
+        """Write as much of the buffer to stdout as it accepts, the rest follows once stdout is writable again."""
         if not self._buffer:
             return
-            
+        if not self._draining:
+            if self._write_available():
+                return
+            self._draining = True
+            asyncio.get_running_loop().add_writer(self._fd, self._on_writable)
+        self._enforce_limit()
+
+    def _on_writable(self):
+        if self._write_available():
+            asyncio.get_running_loop().remove_writer(self._fd)
+            self._draining = False
+
+    def _write_available(self) -> bool:
+        """Write the buffer until stdout would block. Returns whether everything was written."""
+        buffer = self._buffer
+        fd = self._fd
+        written = 0
         try:
-            sys.stdout.buffer.write(b''.join(self._buffer))
-            sys.stdout.flush()
-            self._buffer.clear()
-        except Exception as e:
+            # Straight to the file descriptor, bypassing the locking and chunking of sys.stdout's BufferedWriter
+            with memoryview(buffer) as view:
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+        except BlockingIOError:
+            pass
+        except OSError as e:
             logger.error("Failed to flush buffer to stdout: %s", e)
+            written = len(buffer)
+        if written == len(buffer):
+            self._buffer = bytearray()
+            self._head_in_flight = False
+            return True
+        if written:
+            self._head_in_flight = buffer[written - 1] != 0x0A
+            del buffer[:written]
+        return False
+
+    def _enforce_limit(self):
+        """Drop the oldest complete points beyond _max_buffer_size, ring buffer style."""
+        buffer = self._buffer
+        excess = len(buffer) - self._max_buffer_size
+        if excess <= 0:
+            return
+        # The rest of a line stdout already got part of has to follow, otherwise the output is garbled
+        start = buffer.find(b'\n') + 1 if self._head_in_flight else 0
+        end = buffer.find(b'\n', start + excess - 1) + 1 or len(buffer)
+        self._dropped += buffer.count(b'\n', start, end)
+        del buffer[start:end]
     
     async def write(self, point: bytes) -> None:
         """Write a point to the buffer.
@@ -215,79 +696,167 @@ class ExecDTelegrafWriter(TelegrafWriter):
             point: InfluxDB Point to write
         """
         if point:
-            try:
-                sys.stdout.buffer.write(point + b'\n')
-                sys.stdout.flush()
-            except Exception as e:
-                logger.error("Failed to write to buffer: %s", e)
+            buffer = self._buffer
+            buffer.extend(point)
+            buffer.append(0x0A)  # b'\n'
+            if len(buffer) >= self._buffer_size:
+                self._flush_buffer()
+
+    async def write_many(self, points: list[bytes]) -> None:
+        """Write several points to the buffer."""
+        buffer = self._buffer
+        extend = buffer.extend
+        append = buffer.append
+        for point in points:
+            extend(point)
+            append(0x0A)  # b'\n'
+        if len(buffer) >= self._buffer_size:
+            self._flush_buffer()
 
 class MQTTTelegrafWriter(TelegrafWriter):
     """Writer that publishes metrics to MQTT broker using gmqtt."""
+
+    __slots__ = ('mqtt_config', 'max_retries', 'client', '_initialized', '_STOP', '_buffer', '_flush_task',
+                 '_publish', '_topic', '_reconnect_at', '_reconnect_delay')
     
     def __init__(self):
         """Initialize the MQTT Telegraf writer with connection details."""
+        config = get_config()
         self.mqtt_config = config.telegraf.mqtt
         self.max_retries = config.telegraf.max_retries
         self.client: Optional[MQTTClient] = None
         self._initialized = False
         self._STOP = asyncio.Event()
+        # Newline terminated points, published as one multi-line message every MQTT_FLUSH_INTERVAL
+        self._buffer = bytearray()
+        self._flush_task = None
+        # Bound after connecting, saves the attribute lookups per publish
+        self._publish = None
+        self._topic = None
+        # Loop time of the next reconnect attempt by the periodic flush and the delay after that one
+        self._reconnect_at = 0.0
+        self._reconnect_delay = MQTT_RECONNECT_DELAY
 
     async def initialize(self):
-        """Initialize the MQTT connection if not already initialized."""
+        """Create the MQTT connection to the broker if not already initialized."""
         if not self._initialized:
-            await self.connect()
+            try:
+                self.client = MQTTClient(self.mqtt_config.client_id)
+
+                # Set callbacks
+                self.client.on_connect = self._on_connect
+                self.client.on_disconnect = self._on_disconnect
+                self.client.set_config({'reconnect_retries': self.max_retries if self.max_retries > 0 else MQTTconstants.UNLIMITED_RECONNECTS, 'reconnect_delay': 60})
+                self.client.set_auth_credentials(self.mqtt_config.username, self.mqtt_config.password)
+                # Connect to broker
+                await self.client.connect(
+                    host=self.mqtt_config.host, 
+                    port=self.mqtt_config.port, 
+                    keepalive=60,
+                    version=MQTTconstants.MQTTv311 # MQTTv3.1.1 for performacne reasons - no need for v5
+                )
+                self._publish = self.client.publish
+                self._topic = self.mqtt_config.topic
+                logger.info("Connected to MQTT broker at %s:%d", self.mqtt_config.host, self.mqtt_config.port)
+            except Exception as e:
+                logger.error("Failed to connect to MQTT broker: %s", e)
+                raise
             self._initialized = True
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._periodic_flush())
         return self
 
-    async def connect(self) -> None:
-        """Create MQTT connection to broker."""
-        try:
-            self.client = MQTTClient(self.mqtt_config.client_id)
-
-            # Set callbacks
-            self.client.on_connect = self._on_connect
-            self.client.on_disconnect = self._on_disconnect
-            self.client.set_config({'reconnect_retries': self.max_retries if self.max_retries > 0 else MQTTconstants.UNLIMITED_RECONNECTS, 'reconnect_delay': 60})
-            self.client.set_auth_credentials(self.mqtt_config.username, self.mqtt_config.password)
-            # Connect to broker
-            await self.client.connect(
-                host=self.mqtt_config.host, 
-                port=self.mqtt_config.port, 
-                keepalive=60,
-                version=MQTTconstants.MQTTv311 # MQTTv3.1.1 for performacne reasons - no need for v5
-            )
-            logger.info("Connected to MQTT broker at %s:%d", self.mqtt_config.host, self.mqtt_config.port)
-        except Exception as e:
-            logger.error("Failed to connect to MQTT broker: %s", e)
-            raise
-
     async def close(self) -> None:
-        """Close the MQTT connection."""
+        """Close the MQTT connection, publishing the buffered points first."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self._flush_buffer()
+        await self._disconnect()
+        self._initialized = False
+
+    async def _disconnect(self) -> None:
+        self._publish = None
         if self.client:
             try:
                 await self.client.disconnect()
                 logger.info("Disconnected from MQTT broker")
             except Exception as e:
                 logger.error("Error disconnecting from MQTT broker: %s", e)
-        self._initialized = False
         
     async def write(self, point: bytes) -> None:
-        """Write a point to MQTT broker.
+        """Write a point to the buffer, it is published with the next batch.
         
         Args:
             point: InfluxDB Point to write
         """
-        if not self._initialized:
-            await self.initialize()
-            
-        if point and self.client:
+        if point:
+            self._buffer += point
+            self._buffer += b"\n"
+
+    async def write_many(self, points: list[bytes]) -> None:
+        """Write several points to the buffer."""
+        buffer = self._buffer
+        for point in points:
+            buffer += point
+            buffer += b"\n"
+
+    async def _periodic_flush(self):
+        """Periodically publish the buffer."""
+        while True:
             try:
-                self.client.publish(self.mqtt_config.topic, point, qos=0)
+                await asyncio.sleep(MQTT_FLUSH_INTERVAL)
+                if not self._initialized:
+                    self._trim_buffer()
+                    await self._reconnect()
+                await self._flush_buffer()
+            except asyncio.CancelledError:
+                break
             except Exception as e:
-                logger.error("Failed to publish to MQTT: %s", e)
-                # Try to reconnect
-                await self.close()
-                await self.initialize()
+                logger.error("Error in periodic flush: %s", e)
+
+    async def _flush_buffer(self):
+        """Publish all buffered points as a single message, Telegraf parses multi-line line protocol payloads."""
+        if not self._buffer or self._publish is None:
+            return
+        try:
+            self._publish(self._topic, bytes(self._buffer), qos=0)
+            # Only once published, a failed batch stays buffered for after the reconnect - capped by _trim_buffer
+            self._buffer.clear()
+        except Exception as e:
+            logger.error("Failed to publish to MQTT: %s", e)
+            # The periodic flush reconnects on its next tick
+            await self._disconnect()
+            self._initialized = False
+            self._reconnect_at = 0.0
+
+    async def _reconnect(self) -> None:
+        """Try to reconnect once the delay after the last failed attempt passed, the delay doubles per failure."""
+        now = asyncio.get_running_loop().time()
+        if now < self._reconnect_at:
+            return
+        try:
+            await self.initialize()
+            self._reconnect_delay = MQTT_RECONNECT_DELAY
+        except Exception:
+            # initialize() already logged the cause
+            self._reconnect_at = now + self._reconnect_delay
+            self._reconnect_delay = min(self._reconnect_delay * 2, MQTT_RECONNECT_MAX_DELAY)
+
+    def _trim_buffer(self) -> None:
+        """Drop the oldest complete points beyond MQTT_MAX_BUFFER_SIZE while there is no connection to publish them on."""
+        buffer = self._buffer
+        excess = len(buffer) - MQTT_MAX_BUFFER_SIZE
+        if excess <= 0:
+            return
+        end = buffer.find(b"\n", excess - 1) + 1 or len(buffer)
+        dropped = buffer.count(b"\n", 0, end)
+        del buffer[:end]
+        logger.warning("Dropped %d points while disconnected from the MQTT broker", dropped)
 
     def _on_connect(client, flags, rc, properties, userdata):
         logger.info("MQTT connected")
@@ -299,7 +868,7 @@ class MQTTTelegrafWriter(TelegrafWriter):
 
 def create_telegraf_writer() -> TelegrafWriter:
     """Factory function to create the appropriate TelegrafWriter based on config."""
-    writer_type = config.telegraf.protocol.lower()
+    writer_type = get_config().telegraf.protocol.lower()
     if writer_type == "tcp":
         return TCPTelegrafWriter()
     elif writer_type == "execd":
@@ -308,5 +877,11 @@ def create_telegraf_writer() -> TelegrafWriter:
         return MQTTTelegrafWriter()
     return UDPTelegrafWriter()  # Default to UDP
 
-# Create a global instance
-telegraf = create_telegraf_writer()
\ No newline at end of file
+_telegraf: Optional[TelegrafWriter] = None
+
+def get_telegraf() -> TelegrafWriter:
+    """Get the global TelegrafWriter, created from the config on first use."""
+    global _telegraf
+    if _telegraf is None:
+        _telegraf = create_telegraf_writer()
+    return _telegraf
\ No newline at end of file
@@ -1,6 +1,7 @@
 from datetime import datetime
 import functools
 import logging
+import math
 import time
 import orjson as json
 from typing import Callable, TypeVar, ParamSpec, Optional
@@ -8,7 +9,7 @@ from typing import Callable, TypeVar, ParamSpec, Optional
 import aiohttp
 import asyncio
 
-from .config import config
+from .config import get_config
 from .logger import (
     get_lazy_logger,
     configure_logging,
@@ -22,20 +23,99 @@ P = ParamSpec('P')
 
 CMD_GET_LOXAPP3_JSON_LAST_MODIFIED = "jdev/sps/LoxAPPversion3"
 
+# Line protocol escaping as applied by influxdb_client's Point
+_ESCAPE_MEASUREMENT = str.maketrans({',': r'\,', ' ': r'\ ', '\n': r'\n', '\t': r'\t', '\r': r'\r'})
+_ESCAPE_KEY = str.maketrans({',': r'\,', '=': r'\=', ' ': r'\ ', '\n': r'\n', '\t': r'\t', '\r': r'\r'})
+_ESCAPE_STRING = str.maketrans({'"': r'\"', '\\': r'\\'})
+
 logger = get_lazy_logger(__name__)
 
+# First ASCII characters int() or float() can accept (after leading whitespace), including inf/nan
+_NUMERIC_START = frozenset("+-.0123456789iInN")
 
-def get_numeric_value_if_possible(value):
-    try:
-        return int(value)
-    except ValueError:
+def make_numeric_value_parser(round_floats: bool, rounding_precision: int) -> Callable[[object], object]:
+    """
+    Build get_numeric_value_if_possible for the given rounding settings. They are bound into the closure
+    once instead of being read from the configuration per value.
+    """
+    def get_numeric_value_if_possible(value):
+        """Return value as int or (rounded) float if it represents a number, otherwise unchanged."""
+        if isinstance(value, str):
+            # Plain text is the common failure case - reject it without raising ValueError twice.
+            # Only for ASCII, int() and float() also accept non-ASCII digits like '１２'
+            if value.isascii() and value.lstrip()[:1] not in _NUMERIC_START:
+                return value
+            if value.isdecimal():
+                return int(value)
+        elif isinstance(value, float):
+            # int() would truncate floats that already arrived as numbers
+            return round(value, rounding_precision) if round_floats else value
         try:
-            float_value = float(value)
-            return round(float_value, config.general.rounding_precision) if config.general.round_floats else float_value
+            return int(value)
         except ValueError:
-            return value
+            try:
+                float_value = float(value)
+                return round(float_value, rounding_precision) if round_floats else float_value
+            except ValueError:
+                return value
+
+    return get_numeric_value_if_possible
+
+def format_line_protocol_fields(fields: dict) -> bytes:
+    """
+    Render a line protocol field set with the key escaping and value formatting of influxdb_client's Point,
+    without the overhead of building a Point.
+
+    None and non-finite float values are skipped, whole floats lose their trailing ".0". Unlike Point,
+    fields keep their insertion order and values of other types are written as strings instead of raising.
+    """
+    rendered = []
+    for key, value in fields.items():
+        if value is None:
+            continue
+        key = str(key).translate(_ESCAPE_KEY)
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                continue
+            value = repr(value)
+            if value.endswith(".0"):
+                value = value[:-2]
+            rendered.append(f"{key}={value}")
+        elif isinstance(value, bool):
+            rendered.append(f"{key}={'true' if value else 'false'}")
+        elif isinstance(value, int):
+            rendered.append(f"{key}={value}i")
+        else:
+            rendered.append(f'{key}="{str(value).translate(_ESCAPE_STRING)}"')
+    return ",".join(rendered).encode()
+
+def format_line_protocol_measurement(measurement) -> bytes:
+    """Escape a measurement name the same way influxdb_client's Point does."""
+    return str(measurement).translate(_ESCAPE_MEASUREMENT).encode()
+
+def _escape_tag(key, value) -> str:
+    """Escape a single tag the way Point does. Returns an empty string for tags Point would skip."""
+    key = str(key).translate(_ESCAPE_KEY)
+    value = str(value).translate(_ESCAPE_KEY)
+    if value.endswith('\\'):
+        value += ' '
+    return f",{key}={value}" if key and value else ""
+
+def format_line_protocol_tag(key, value) -> bytes:
+    """Render a single comma prefixed line protocol tag, e.g. to splice it into an already rendered tag set."""
+    return _escape_tag(key, value).encode() if value is not None else b""
+
+def format_line_protocol_tags(tags: dict) -> bytes:
+    """
+    Render line protocol tags the same way influxdb_client's Point does, each one prefixed with a comma
+    so the result can be appended to the measurement or to another tag set directly.
+
+    Tags are sorted by key, tags with None or empty values are skipped.
+    """
+    return "".join([_escape_tag(key, value) for key, value in sorted(tags.items()) if value is not None]).encode()
 
 def _build_base_url():
+        config = get_config()
         protocol = "https" if config.miniserver.port == 443 else "http"
         
         # Include port in URL if it's not the default port for the protocol
@@ -53,24 +133,35 @@ def log_performance(name: Optional[str] = None, severity: Optional[int] = loggin
         name: Optional name to use in the log message. If not provided, uses the function name.
     """
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        logger = logging.getLogger(func.__module__)
+        is_enabled_for = logger.isEnabledFor
+        log = logger.log
+        operation_name = name or func.__name__
+        logging_ensured = False
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            ensure_basic_logging()  # Ensure logging is configured
-            logger = logging.getLogger(func.__module__)
+            nonlocal logging_ensured
+            if not logging_ensured:
+                # On the first call rather than at decoration, importing must not load the configuration
+                ensure_basic_logging()
+                logging_ensured = True
+            # Decoration happens at import, before the log level is configured - so check per call
+            if not is_enabled_for(severity):
+                return func(*args, **kwargs)
             
-            operation_name = name or func.__name__
             start_time = time.perf_counter_ns()
             
             try:
                 result = func(*args, **kwargs)
                 end_time = time.perf_counter_ns()
                 duration_ms = (end_time - start_time)
-                logger.log(severity, "Performance: %s took %.2fns", operation_name, duration_ms)
+                log(severity, "Performance: %s took %.2fns", operation_name, duration_ms)
                 return result
             except Exception as e:
                 end_time = time.perf_counter_ns()
                 duration_ms = (end_time - start_time)
-                logger.debug("Performance: %s failed after %.2fns with error: %s", operation_name, duration_ms, str(e))
+                logger.debug("Performance: %s failed after %.2fns with error: %s", operation_name, duration_ms, e)
                 raise
                 
         return wrapper
@@ -86,18 +177,40 @@ def checkIfElementInLox3APP(loxapp3_json_control_list, controls, uuid):
             logger.warning("%s not in the LoxAPP3.json and not in the overall controls list", uuid)
 
 
+# Shared by all get_loxapp3_json_last_modified calls, keeps the connection to the miniserver alive between them
+_session: Optional[aiohttp.ClientSession] = None
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        miniserver = get_config().miniserver
+        _session = aiohttp.ClientSession(
+            auth=aiohttp.BasicAuth(login=miniserver.user, password=miniserver.password),
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(ssl=False, limit=4, keepalive_timeout=300)  # Disable SSL verification
+        )
+    return _session
+
+async def close_session() -> None:
+    """Close the shared miniserver HTTP session, called on shutdown."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
 async def get_loxapp3_json_last_modified():
-    async with aiohttp.ClientSession(
-            auth=aiohttp.BasicAuth(login=config.miniserver.username, password=config.miniserver.password),
-            timeout=aiohttp.ClientTimeout(total=30)
-        ) as client:
-            async with client.get(
-                f"{_build_base_url()}/{CMD_GET_LOXAPP3_JSON_LAST_MODIFIED}",
-                allow_redirects=True,
-                ssl=False  # Disable SSL verification
-            ) as response:
-                if response.status != 200:
-                    logger.warning("Non-200 response received: %s", response.status)
-                    return None
-                
-                return datetime.strptime(await response.json(loads=json.loads)["LL"]["value"], "%Y-%m-%d %H:%M:%S")
+    client = _get_session()
+    async with client.get(
+        f"{_build_base_url()}/{CMD_GET_LOXAPP3_JSON_LAST_MODIFIED}",
+        allow_redirects=True
+    ) as response:
+        if response.status != 200:
+            logger.warning("Non-200 response received: %s", response.status)
+            return None
+        
+        # The miniserver does not necessarily answer with an application/json content type
+        data = await response.json(loads=json.loads, content_type=None)
+        value = data["LL"]["value"]
+        # Fixed "%Y-%m-%d %H:%M:%S" layout, sliced directly instead of going through strptime
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19]))
@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+from loxInFlux import app, logger, telegraf
+
+
+def test_telegraf_writer_uses_initialized_tcp_writes(monkeypatch):
+    """The writer task starts before telegraf.initialize() - its batches must still take the initialized path."""
+    calls = []
+    write_many_initialized = telegraf.TCPTelegrafWriter._write_many_initialized
+
+    async def spy(self, points):
+        calls.append(list(points))
+        await write_many_initialized(self, points)
+
+    async def uninitialized_spy(self, points):
+        raise AssertionError("batch went through the uninitialized write_many")
+
+    monkeypatch.setattr(telegraf.TCPTelegrafWriter, "_write_many_initialized", spy)
+    monkeypatch.setattr(telegraf.TCPTelegrafWriter, "_write_many_uninitialized", uninitialized_spy)
+    # Configured explicitly, auto-configuration would load the configuration from the command line
+    logger.configure_logging("INFO")
+
+    async def run():
+        received = asyncio.Event()
+
+        async def handle(reader, writer):
+            await reader.readline()
+            received.set()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        monkeypatch.setattr(telegraf, "get_config", lambda: SimpleNamespace(
+            telegraf=SimpleNamespace(host="127.0.0.1", port=port, max_retries=1)))
+        writer = telegraf.TCPTelegrafWriter()
+
+        bridge = app.LoxInfluxBridge.__new__(app.LoxInfluxBridge)
+        bridge.telegraf = writer
+        bridge._telegraf_queue = asyncio.Queue()
+        # Same order as main(): the writer task first, the connection afterwards
+        writer_task = asyncio.create_task(bridge._telegraf_writer())
+        await asyncio.sleep(0)
+        await writer.initialize()
+
+        bridge._telegraf_queue.put_nowait(b"m value=1i 1")
+        await asyncio.sleep(0)
+        await writer.close()
+        await asyncio.wait_for(received.wait(), 5)
+
+        writer_task.cancel()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+    assert calls == [[b"m value=1i 1"]]